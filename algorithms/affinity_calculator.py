@@ -9,7 +9,7 @@ from collections import defaultdict
 from collections.abc import Callable, Iterable
 from itertools import combinations
 
-from utils.git import ensure_list
+from utils.git import changed_files, ensure_list
 
 
 def _calculate_affinities_from_commits(
@@ -28,7 +28,7 @@ def _calculate_affinities_from_commits(
         weight_fn: Function mapping number of files in a commit to a per-pair weight
     """
     for commit in commits:
-        files = list(commit.stats.files)
+        files = list(changed_files(commit))
         files_in_commit = len(files)
 
         if files_in_commit < 2:
@@ -29,34 +29,26 @@ def calculate_chain_layout(
         - Metadata (commit count, SHAs)
         - Derived metrics (duration in days, density)
     """
-    rows = []
     stacker = SequenceStacker()
-
-    for clamped in clamped_chains:
-        # Calculate elevation using stacker to prevent overlaps
-        height = stacker.height_for(
-            [clamped.clamped_first, clamped.clamped_last]
-        )
-
-        # Calculate derived metrics
-        duration_days = clamped.clamped_duration.days
-        density = (
-            (duration_days / clamped.commit_count)
-            if clamped.commit_count
-            else 0
-        )
-
-        row = TimelineRow(
-            first=clamped.clamped_first,
-            last=clamped.clamped_last,
-            elevation=height,
-            commit_counts=clamped.commit_count,
-            head=clamped.earliest_sha,
-            tail=clamped.latest_sha,
-            duration=duration_days,
-            density=density,
-        )
-
-        rows.append(row)
-
-    return rows
+    return [_timeline_row(clamped, stacker) for clamped in clamped_chains]
+
+
+def _timeline_row(
+    clamped: ClampedChain, stacker: SequenceStacker
+) -> TimelineRow:
+    """Build the TimelineRow for one chain, stacking it above overlaps."""
+    first = clamped.clamped_first
+    last = clamped.clamped_last
+    count = clamped.commit_count
+    duration_days = clamped.clamped_duration.days
+
+    return TimelineRow(
+        first=first,
+        last=last,
+        elevation=stacker.height_for([first, last]),
+        commit_counts=count,
+        head=clamped.earliest_sha,
+        tail=clamped.latest_sha,
+        duration=duration_days,
+        density=(duration_days / count) if count else 0,
+    )
@@ -7,7 +7,7 @@ results for display in Dash tables.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Protocol, runtime_checkable
@@ -79,37 +79,37 @@ def traverse_linear_chain(
     if not latest_commit:
         raise LinearChainTraversalError("latest_commit is required")
 
-    path: list[HasCommitFields] = [latest_commit]
+    path: list[HasCommitFields] = []
     current = latest_commit
-    steps = 0
 
-    while current.hexsha != earliest_sha:
-        steps += 1
-        if steps > max_steps:
-            raise LinearChainTraversalError(
-                "Maximum traversal depth exceeded while walking commit chain"
-            )
+    # One extra pass lets the walk take exactly max_steps parent hops.
+    for _ in range(max_steps + 1):
+        path.append(current)
+        if current.hexsha == earliest_sha:
+            # We walked from latest -> earliest; reverse for chronological order
+            path.reverse()
+            return path
 
-        parents = list(getattr(current, "parents", []) or [])
+        parents = getattr(current, "parents", None) or ()
         if not parents:
             raise LinearChainTraversalError(
                 "Reached a commit with no parents before finding earliest_sha"
             )
-        if len(parents) != 1:
+        if len(parents) > 1:
             raise LinearChainTraversalError(
                 "Encountered a non-linear commit (multiple parents) in chain traversal"
             )
-
         current = parents[0]
-        path.append(current)
 
-    # We walked from latest -> earliest; reverse for chronological order
-    return list(reversed(path))
+    raise LinearChainTraversalError(
+        "Maximum traversal depth exceeded while walking commit chain"
+    )
 
 
 def commits_to_chain_rows(
     commits: Iterable[HasCommitFields],
     branch_getter: Callable[[HasCommitFields], str] | None = None,
+    branch_map: Mapping[str, str] | None = None,
 ) -> list[dict[str, str]]:
     """Convert commits into dictionaries suitable for a Dash DataTable.
 
@@ -121,41 +121,48 @@ def commits_to_chain_rows(
     - ``message``: first line of the commit message (truncated to 100 chars)
 
     ``branch_getter`` is optional; when provided it is called with each commit
-    to obtain a branch name for display.
+    to obtain a branch name for display. ``branch_map`` is a precomputed
+    alternative mapping full SHAs to branch names; it takes precedence over
+    ``branch_getter``.
     """
 
-    rows: list[dict[str, str]] = []
-
-    for commit in commits:
-        # Short hash
-        short_hash = (commit.hexsha or "")[:7]
-
-        # Date formatting (use local time as in other views)
-        committed_dt = commit.committed_datetime
-        date_str = committed_dt.strftime("%Y-%m-%d %H:%M")
-
-        # Branch name (if available)
-        branch = branch_getter(commit) if branch_getter is not None else ""
-
-        # Author name (fall back gracefully if missing)
-        author_obj = getattr(commit, "author", None)
-        author_name = (
-            getattr(author_obj, "name", "") if author_obj is not None else ""
-        )
-
-        # First line of message, truncated
-        message_full = commit.message or ""
-        first_line = message_full.split("\n", 1)[0]
-        message = first_line[:100]
-
-        rows.append(
-            {
-                "hash": short_hash,
-                "date": date_str,
-                "branch": branch,
-                "author": author_name,
-                "message": message,
-            }
-        )
-
-    return rows
+    if branch_map is not None:
+        get_branch = _branch_from_map(branch_map)
+    else:
+        get_branch = branch_getter or _no_branch
+    return [
+        {
+            "hash": (commit.hexsha or "")[:7],
+            "date": _format_minutes(commit.committed_datetime),
+            "branch": get_branch(commit),
+            "author": _author_name(commit),
+            "message": (commit.message or "").partition("\n")[0][:100],
+        }
+        for commit in commits
+    ]
+
+
+def _no_branch(_commit: HasCommitFields) -> str:
+    """Default branch getter used when the caller supplies none."""
+    return ""
+
+
+def _branch_from_map(
+    branch_map: Mapping[str, str],
+) -> Callable[[HasCommitFields], str]:
+    """Adapt a SHA -> branch mapping to the branch getter signature."""
+    return lambda commit: branch_map.get(commit.hexsha, "")
+
+
+def _format_minutes(moment: datetime) -> str:
+    """Format as ``YYYY-MM-DD HH:MM`` without strftime's locale machinery."""
+    return (
+        f"{moment.year:04d}-{moment.month:02d}-{moment.day:02d} "
+        f"{moment.hour:02d}:{moment.minute:02d}"
+    )
+
+
+def _author_name(commit: HasCommitFields) -> str:
+    """Return the commit author's name, or an empty string if missing."""
+    author = getattr(commit, "author", None)
+    return getattr(author, "name", "") if author is not None else ""
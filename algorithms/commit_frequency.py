@@ -12,6 +12,18 @@ from datetime import datetime
 
 from git import Commit, Repo
 
+from algorithms.file_changes import FileChangeStats
+from utils.git import changed_files
+
+# Shared stand-in for files that files_changes_over_period has no stats for
+_NO_CHANGE_STATS = FileChangeStats(
+    file_path="",
+    commits=0,
+    avg_changes=0.0,
+    total_change=0,
+    percent_change=0.0,
+)
+
 
 def calculate_file_commit_frequency(
     commits_data: Iterable[Commit],
@@ -31,13 +43,15 @@ def calculate_file_commit_frequency(
         - total_change: Total lines changed
         - percent_change: Percentage change in file size
     """
+    if top_n <= 0:
+        return []
+
     from algorithms.file_changes import files_changes_over_period
 
     counter = Counter()
     for commit in commits_data:
         try:
-            files = commit.stats.files.keys()
-            counter.update(files)
+            counter.update(changed_files(commit).keys())
         except ValueError:
             logging.getLogger(__name__).exception("Error processing commit")
             raise
@@ -49,30 +63,19 @@ def calculate_file_commit_frequency(
     # Get additional metrics for these files
     file_stats = files_changes_over_period(filenames, begin, end, repo)
 
-    # Create a list of dictionaries with all metrics
+    # Create a list of dictionaries with all metrics; files without stats
+    # report zeros for the change metrics.
     result = []
     for filename, count in most_common_files:
-        if filename in file_stats:
-            stats = file_stats[filename]
-            result.append(
-                {
-                    "filename": filename,
-                    "count": count,
-                    "avg_changes": round(stats.avg_changes, 2),
-                    "total_change": stats.total_change,
-                    "percent_change": round(stats.percent_change, 2),
-                }
-            )
-        else:
-            # If no stats available, use zeros for the additional metrics
-            result.append(
-                {
-                    "filename": filename,
-                    "count": count,
-                    "avg_changes": 0.0,
-                    "total_change": 0,
-                    "percent_change": 0.0,
-                }
-            )
+        stats = file_stats.get(filename, _NO_CHANGE_STATS)
+        result.append(
+            {
+                "filename": filename,
+                "count": count,
+                "avg_changes": round(stats.avg_changes, 2),
+                "total_change": stats.total_change,
+                "percent_change": round(stats.percent_change, 2),
+            }
+        )
 
     return result
@@ -29,23 +29,28 @@ def build_commit_graph(commits: list[Any]) -> nx.Graph:
             - Edges connect parent commits to child commits
             - Merge commits are excluded
     """
-    graph = nx.Graph()
+    # Collect everything first, then hand NetworkX two bulk inserts.
+    # Later sightings of a SHA overwrite its timestamp, as add_node would.
+    committed_by_sha: dict[str, Any] = {}
+    edges: list[tuple[str, str]] = []
 
     for commit in commits:
-        # Skip merge commits (multiple parents)
-        if len(commit.parents) > 1:
+        # Only single-parent commits contribute: merges (several parents)
+        # are skipped, and root commits (none) have no edge to add.
+        parents = commit.parents
+        if len(parents) != 1:
             continue
 
-        for parent in commit.parents:
-            # Store only the committed datetime; the node key itself is the SHA.
-            graph.add_node(
-                parent.hexsha,
-                committed=parent.committed_datetime,
-            )
-            graph.add_node(
-                commit.hexsha,
-                committed=commit.committed_datetime,
-            )
-            graph.add_edge(parent.hexsha, commit.hexsha)
+        parent = parents[0]
+        # Store only the committed datetime; the node key itself is the SHA.
+        committed_by_sha[parent.hexsha] = parent.committed_datetime
+        committed_by_sha[commit.hexsha] = commit.committed_datetime
+        edges.append((parent.hexsha, commit.hexsha))
 
+    graph = nx.Graph()
+    graph.add_nodes_from(
+        (sha, {"committed": committed})
+        for sha, committed in committed_by_sha.items()
+    )
+    graph.add_edges_from(edges)
     return graph
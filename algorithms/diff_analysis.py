@@ -4,11 +4,13 @@ Diff Analysis Module
 This module provides functions for analyzing diffs and changes across commits.
 """
 
-from collections import defaultdict
 from datetime import datetime
 
 import pandas as pd
 
+# Kinds in the sorted order they appear within each day of the result
+_DIFF_KINDS = ["net deletes", "net inserts", "possible mods"]
+
 
 def get_diffs_in_period(
     commits_data, start: datetime, end: datetime
@@ -29,19 +31,26 @@ def get_diffs_in_period(
     Returns:
         A pandas DataFrame with columns: date, kind, count
     """
-    counts = defaultdict(int)
-    for commit in commits_data:
-        day = commit.committed_datetime.date()
-        inserted = commit.stats.total["insertions"]
-        deleted = commit.stats.total["deletions"]
-
-        possible_mods = min(inserted, deleted)
-        counts[day, "possible mods"] += possible_mods
-        counts[day, "net inserts"] += max(inserted - possible_mods, 0)
-        counts[day, "net deletes"] += max(deleted - possible_mods, 0)
-
-    source_data = sorted(
-        (day, kind, count) for ((day, kind), count) in counts.items()
+    # One stats lookup per commit: each access to Commit.stats runs git.
+    totals = [
+        (commit.committed_datetime.date(), commit.stats.total)
+        for commit in commits_data
+    ]
+    if not totals:
+        return pd.DataFrame(columns=["date", "kind", "count"])
+
+    per_commit = pd.DataFrame(
+        [
+            (day, total["insertions"], total["deletions"])
+            for day, total in totals
+        ],
+        columns=["date", "insertions", "deletions"],
     )
-    result = pd.DataFrame(source_data, columns=["date", "kind", "count"])
-    return result
+    possible_mods = per_commit[["insertions", "deletions"]].min(axis=1)
+    per_commit["possible mods"] = possible_mods
+    per_commit["net inserts"] = per_commit["insertions"] - possible_mods
+    per_commit["net deletes"] = per_commit["deletions"] - possible_mods
+
+    per_day = per_commit.groupby("date")[_DIFF_KINDS].sum().reset_index()
+    result = per_day.melt(id_vars="date", var_name="kind", value_name="count")
+    return result.sort_values(["date", "kind"], ignore_index=True)
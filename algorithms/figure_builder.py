@@ -6,8 +6,37 @@ Plotly timeline visualizations.
 """
 
 import plotly.express as px
+import plotly.graph_objects as go
 from pandas import DataFrame
 
+_TITLE = "Code Lines (selected period)"
+
+# The figure's fixed configuration, built once rather than on every
+# callback. px.timeline reads these without modifying them.
+
+# Expose chain boundary SHAs so the codelines page can recover the
+# full chain when a bar is selected.
+_CUSTOM_DATA = ["head", "tail"]
+
+_LABELS = {
+    "elevation": "",  # pragma: no mutate
+    "density": "Commit Sparsity",  # pragma: no mutate
+    "first": "Begun",  # pragma: no mutate
+    "last": "Ended",  # pragma: no mutate
+    "duration": "Days",  # pragma: no mutate
+}
+
+_HOVER_DATA = {
+    "first": True,
+    "head": True,
+    "last": True,
+    "tail": True,
+    "commit_counts": True,
+    "duration": True,
+    "elevation": False,
+    "density": True,
+}
+
 
 def create_timeline_figure(df: DataFrame):
     """
@@ -28,34 +57,22 @@ def create_timeline_figure(df: DataFrame):
             - duration: Duration in days
 
     Returns:
-        Plotly Figure object configured for timeline display.
+        Plotly Figure object configured for timeline display. An empty
+        DataFrame gets a titled, trace-free figure without going through
+        Plotly Express.
     """
+    if df.empty:
+        return go.Figure(layout={"title": {"text": _TITLE}})
+
     figure = px.timeline(
         data_frame=df,
         x_start="first",
         x_end="last",
         y="elevation",
         color="density",
-        # Expose chain boundary SHAs so the codelines page can recover the
-        # full chain when a bar is selected.
-        custom_data=["head", "tail"],
-        title="Code Lines (selected period)",
-        labels={
-            "elevation": "",  # pragma: no mutate
-            "density": "Commit Sparsity",  # pragma: no mutate
-            "first": "Begun",  # pragma: no mutate
-            "last": "Ended",  # pragma: no mutate
-            "duration": "Days",  # pragma: no mutate
-        },
-        hover_data={
-            "first": True,
-            "head": True,
-            "last": True,
-            "tail": True,
-            "commit_counts": True,
-            "duration": True,
-            "elevation": False,
-            "density": True,
-        },
+        custom_data=_CUSTOM_DATA,
+        title=_TITLE,
+        labels=_LABELS,
+        hover_data=_HOVER_DATA,
     )
     return figure
@@ -1,14 +1,24 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from statistics import mean
-from typing import NamedTuple
 
 import git
 
 from utils.git import get_repo as get_repo_util
 
+# Upper bound on concurrent per-file git walks in files_changes_over_period
+_MAX_GIT_WORKERS = 8
 
-class FileChangeStats(NamedTuple):
+# A blob's size at a given commit never changes, so sizes are kept across
+# queries; files and periods that overlap reuse them.
+_GIT_OBJECT_CACHE_SIZE = 65_536
+
+
+@dataclass(frozen=True, slots=True)
+class FileChangeStats:
     """Statistics about changes to a file over a period of time."""
 
     file_path: str
@@ -23,48 +33,75 @@ def _dt_arg(dt: datetime) -> str:
     return dt.astimezone().replace(microsecond=0).isoformat(sep=" ")
 
 
-def _commits_touching_file(
+def _resolve_window(
+    start: datetime | None, end: datetime | None
+) -> tuple[datetime, datetime]:
+    """Fill in the default window: the year up to now, read from one clock."""
+    now = datetime.now()
+    return start or now - timedelta(days=365), end or now
+
+
+def _lines_changed_by_commit(
     repo: git.Repo,
     target_file: str,
     start: datetime,
     end: datetime,
-) -> list[str]:
-    """Return commit SHAs that touch target_file in [start, end].
-
-    Uses the git CLI directly rather than Commit.stats to avoid GitPython's
-    batch object reader desync issues.
+) -> dict[str, int]:
+    """Return lines changed (adds + dels) in target_file, per commit SHA.
+
+    Covers the commits touching target_file in [start, end], newest first.
+    One ``git log --numstat`` stream replaces a rev-list plus a ``git show``
+    per commit. ``--cc`` gives merges the same diff ``git show`` does and
+    keeps git's default merge simplification, so the commits listed match
+    ``git rev-list``; it also works on git older than 2.31, which lacks
+    ``--diff-merges``. Uses the git CLI directly rather than Commit.stats
+    to avoid GitPython's batch object reader desync issues.
     """
-    output = repo.git.rev_list(
+    output = repo.git.log(
         "--all",
         f"--since={_dt_arg(start)}",
         f"--until={_dt_arg(end)}",
+        "--numstat",
+        "--cc",
+        "--format=%H",
         "--",
         target_file,
     )
 
-    shas = [line.strip() for line in output.splitlines() if line.strip()]
-    return shas
-
-
-def _lines_changed_in_commit(repo: git.Repo, sha: str, target_file: str) -> int:
-    """Return total lines changed (adds + dels) for target_file in commit sha."""
-    # `--format=` suppresses commit headers; `--numstat` gives per-file counts.
-    output = repo.git.show(sha, "--numstat", "--format=", "--", target_file)
+    lines_by_sha: dict[str, int] = {}
+    sha = None
     for line in output.splitlines():
-        parts = line.split("\t")
-        if len(parts) < 3:
+        # numstat lines are "<adds>\t<dels>\t<path>"; SHA lines have no tab.
+        adds_s, tab, rest = line.partition("\t")
+        if not tab:
+            if line.strip():
+                sha = line.strip()
+                lines_by_sha[sha] = 0
             continue
-        adds_s, dels_s, _path = parts[0], parts[1], parts[2]
-        adds = int(adds_s) if adds_s.isdigit() else 0
-        dels = int(dels_s) if dels_s.isdigit() else 0
-        return adds + dels
-    return 0
+        # Count only the first numstat line after each SHA.
+        if sha is not None:
+            dels_s = rest.partition("\t")[0]
+            adds = int(adds_s) if adds_s.isdigit() else 0
+            dels = int(dels_s) if dels_s.isdigit() else 0
+            lines_by_sha[sha] = adds + dels
+            sha = None
+    return lines_by_sha
+
+
+@lru_cache(maxsize=_GIT_OBJECT_CACHE_SIZE)
+def _cached_blob_size(repo: git.Repo, sha: str, target_file: str) -> int:
+    # Raises on failure, so lru_cache keeps only real sizes.
+    return int(repo.git.cat_file("-s", f"{sha}:{target_file}").strip())
 
 
 def _blob_size_at_commit(repo: git.Repo, sha: str, target_file: str) -> int:
-    """Return blob size (in bytes) for target_file at commit sha."""
+    """Return blob size (in bytes) for target_file at commit sha.
+
+    Failures read as 0 but are not cached, so a transient ``cat-file``
+    error is retried on the next query.
+    """
     try:
-        return int(repo.git.cat_file("-s", f"{sha}:{target_file}").strip())
+        return _cached_blob_size(repo, sha, target_file)
     except Exception:
         return 0
 
@@ -76,17 +113,15 @@ def file_changes_over_period(
     repo: git.Repo | None = None,
 ) -> tuple[int, float, int, float]:
     """Calculate statistics about changes to a file over a period of time."""
-    start = start or datetime.now() - timedelta(days=365)
-    end = end or datetime.now()
+    start, end = _resolve_window(start, end)
     repo = repo or get_repo_util()
 
-    shas = _commits_touching_file(repo, target_file, start, end)
-    if not shas:
+    lines_by_sha = _lines_changed_by_commit(repo, target_file, start, end)
+    if not lines_by_sha:
         return 0, 0.0, 0, 0.0
 
-    lines_changed = [
-        _lines_changed_in_commit(repo, sha, target_file) for sha in shas
-    ]
+    shas = list(lines_by_sha)
+    lines_changed = list(lines_by_sha.values())
     commits = len(shas)
     avg_changes = mean(lines_changed) if lines_changed else 0.0
 
@@ -125,38 +160,88 @@ def files_changes_over_period(
     Returns:
         A dictionary mapping file paths to FileChangeStats objects
     """
-    start = start or datetime.now() - timedelta(days=365)
-    end = end or datetime.now()
+    start, end = _resolve_window(start, end)
     repo = repo or get_repo_util()
 
-    results = {}
-
-    for file_path in target_files:
-        try:
-            commits, avg_changes, total_change, percent_change = (
-                file_changes_over_period(file_path, start, end, repo)
-            )
-
-            stats = FileChangeStats(
-                file_path=file_path,
-                commits=commits,
-                avg_changes=avg_changes,
-                total_change=total_change,
-                percent_change=percent_change,
-            )
-
-            results[file_path] = stats
-
-        except Exception:
-            logging.getLogger(__name__).exception(
-                f"Error processing file {file_path}"
-            )
-            results[file_path] = FileChangeStats(
-                file_path=file_path,
-                commits=0,
-                avg_changes=0.0,
-                total_change=0,
-                percent_change=0.0,
-            )
-
-    return results
+    # Sorting canonicalizes the cache key; callers look results up by path.
+    try:
+        results = _cached_files_changes(
+            tuple(sorted(target_files)), start, end, repo
+        )
+    except _IncompleteStats as incomplete:
+        # Raised out of the cache, so the next query retries the failed files.
+        results = {
+            file_path: stats or _zero_stats(file_path)
+            for file_path, stats in incomplete.stats.items()
+        }
+    return dict(results)
+
+
+class _IncompleteStats(Exception):
+    """Git failed for some files; carries what was computed so far."""
+
+    def __init__(self, stats: dict[str, FileChangeStats | None]):
+        super().__init__(stats)
+        self.stats = stats
+
+
+# Same bound as data._cached_commits: the current period and the last one.
+@lru_cache(maxsize=2)
+def _cached_files_changes(
+    target_files: tuple[str, ...],
+    start: datetime,
+    end: datetime,
+    repo: git.Repo,
+) -> dict[str, FileChangeStats]:
+    """Memoized worker for files_changes_over_period.
+
+    Each file costs several git invocations, and the dashboard asks for the
+    same files and period again on every refresh. Files are independent and
+    every git call is its own subprocess, so they are fetched concurrently.
+    Raises _IncompleteStats rather than caching a batch where git failed.
+    """
+    if not target_files:
+        return {}
+
+    workers = min(_MAX_GIT_WORKERS, len(target_files))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            lambda file_path: _file_change_stats(file_path, start, end, repo),
+            target_files,
+        )
+        stats = dict(zip(target_files, results, strict=True))
+    if None in stats.values():
+        raise _IncompleteStats(stats)
+    return stats
+
+
+def _file_change_stats(
+    file_path: str, start: datetime, end: datetime, repo: git.Repo
+) -> FileChangeStats | None:
+    """Return stats for one file, or None if git could not provide them."""
+    try:
+        commits, avg_changes, total_change, percent_change = (
+            file_changes_over_period(file_path, start, end, repo)
+        )
+    except Exception:
+        logging.getLogger(__name__).exception(
+            f"Error processing file {file_path}"
+        )
+        return None
+    return FileChangeStats(
+        file_path=file_path,
+        commits=commits,
+        avg_changes=avg_changes,
+        total_change=total_change,
+        percent_change=percent_change,
+    )
+
+
+def _zero_stats(file_path: str) -> FileChangeStats:
+    return FileChangeStats(
+        file_path=file_path,
+        commits=0,
+        avg_changes=0.0,
+        total_change=0,
+        percent_change=0.0,
+    )
@@ -9,18 +9,20 @@ from collections.abc import Iterable
 
 import networkx as nx
 
+from utils.git import changed_files
+
 
 def count_files_in_commits(commits: Iterable) -> dict[str, int]:
     """Count how many commits each file appears in."""
     counter = Counter()
     for commit in commits:
-        counter.update(commit.stats.files.keys())
+        counter.update(changed_files(commit).keys())
     return dict(counter)
 
 
 def count_multi_file_commits(commits: Iterable) -> int:
     """Count commits that modify 2 or more files."""
-    return sum(1 for commit in commits if len(commit.stats.files) >= 2)
+    return sum(1 for commit in commits if len(changed_files(commit)) >= 2)
 
 
 def calculate_graph_statistics(G: nx.Graph) -> dict[str, float]:
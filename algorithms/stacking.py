@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from collections import defaultdict
 
 
@@ -6,16 +7,35 @@ def is_disjoint(seq1, seq2):
 
 
 class SequenceStacker:
+    """Assign each sequence the lowest level where it overlaps nothing.
+
+    Sequences on one level never overlap, so keeping each level sorted by
+    start also keeps it sorted by end. A new sequence then only needs to be
+    checked against its two neighbours, found by binary search, instead of
+    against every sequence already on the level.
+    """
+
     def __init__(self):
         self.level_assignments = defaultdict(list)
+        self._level_starts = defaultdict(list)
 
     def height_for(self, sequence):
-        assignment = 1
-        for level, neighbors in sorted(self.level_assignments.items()):
+        level = 1
+        while level in self.level_assignments:
             neighbors = self.level_assignments[level]
-            if all(is_disjoint(sequence, existing) for existing in neighbors):
-                assignment = level
+            index = bisect_left(self._level_starts[level], sequence[0])
+            if _fits_between(neighbors, index, sequence):
                 break
-            assignment = level + 1
-        self.level_assignments[assignment].append(sequence)
-        return assignment
+            level += 1
+        else:
+            index = 0
+        self.level_assignments[level].insert(index, sequence)
+        self._level_starts[level].insert(index, sequence[0])
+        return level
+
+
+def _fits_between(neighbors, index, sequence):
+    """True if ``sequence`` is disjoint from the neighbours around ``index``."""
+    if index > 0 and not is_disjoint(sequence, neighbors[index - 1]):
+        return False
+    return index == len(neighbors) or is_disjoint(sequence, neighbors[index])
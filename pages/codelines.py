@@ -1,3 +1,5 @@
+import re
+
 from dash import Input, Output, callback, dcc, html, register_page
 from dash.dash_table import DataTable
 
@@ -16,6 +18,9 @@ from utils import date_utils
 
 register_page(module=__name__, title="Concurrent Efforts")
 
+# Leaf of the ref in a name_rev string, e.g. "<sha> remotes/origin/main" -> "main"
+_NAME_REV_BRANCH = re.compile(r"^\S+\s+(?:\S*/)?([^\s/]*)")
+
 layout = html.Div(
     [
         html.H2("Concurrent Effort", style={"margin": "10px 0"}),
@@ -110,8 +115,9 @@ def branch_for_commit(commit):
 
     When commits originate from ``iter_commits('--all', ...)``, GitPython attaches reference
     information that we can use directly. We first try ``commit.refs`` (references that point
-    at this commit), and fall back to ``commit.name_rev`` if needed. No extra git commands are
-    issued per commit.
+    at this commit), and fall back to ``commit.name_rev`` if needed. Nothing is cached here:
+    ``name_rev`` answers like ``main~3`` go stale as branches move, so callers resolve each
+    commit once per callback (see ``update_chain_commits_table``).
     """
     # Prefer explicit refs attached to the commit
     refs = getattr(commit, "refs", None)
@@ -127,13 +133,10 @@ def branch_for_commit(commit):
 
     # Fallback: parse name_rev if available, e.g. "<sha> main" or "<sha> tags/v1.0^0"
     name_rev = getattr(commit, "name_rev", "")
-    if isinstance(name_rev, str) and name_rev:
-        parts = name_rev.split()
-        if len(parts) > 1:
-            ref_part = parts[1]
-            if "/" in ref_part:
-                ref_part = ref_part.split("/")[-1]
-            return ref_part
+    if isinstance(name_rev, str):
+        match = _NAME_REV_BRANCH.match(name_rev)
+        if match:
+            return match.group(1)
 
     return ""
 
@@ -154,18 +157,19 @@ def update_chain_commits_table(click_data):
         return []
 
     point = click_data["points"][0]
-    custom_data = point.get("customdata") or []
-    if len(custom_data) < 2:
+    try:
+        earliest_sha, latest_sha, *_ = point.get("customdata") or ()
+    except (TypeError, ValueError):
         # If we don't have both head and tail SHAs, we cannot build the chain.
         return []
 
-    earliest_sha = custom_data[0]
-    latest_sha = custom_data[1]
-
     # Resolve commits from the repository and traverse the linear chain.
     repo = data.get_repo()
     latest_commit = repo.commit(latest_sha)
     chain_commits = traverse_linear_chain(latest_commit, earliest_sha)
 
-    # Format for DataTable consumption, including branch column.
-    return commits_to_chain_rows(chain_commits, branch_getter=branch_for_commit)
+    # Resolve branches once for the chain, then format for the DataTable.
+    branch_map = {
+        commit.hexsha: branch_for_commit(commit) for commit in chain_commits
+    }
+    return commits_to_chain_rows(chain_commits, branch_map=branch_map)
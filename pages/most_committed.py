@@ -187,7 +187,7 @@ def update_word_frequency(active_cell, store_data, table_data):
 
     # Get commit messages for the file
     repo = data.get_repo()
-    messages = list(get_commit_messages_for_file(repo, filename, begin, end))
+    messages = get_commit_messages_for_file(repo, filename, begin, end)
 
     if not messages:
         return create_empty_figure(f"No commit messages found for {filename}")
@@ -2,23 +2,16 @@
 Test package for gitminer-dash.
 
 This package contains all the tests for the gitminer-dash project.
+
+Importing the package puts the project root on ``sys.path`` so test modules
+can import ``data``, ``algorithms`` and friends. pytest imports it once, before
+``conftest.py``, so individual test modules need no path setup of their own.
 """
 
 import os
 import sys
 
-# Add the parent directory to the path so we can import modules from the root
-sys.path.insert(
-    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-)
-
-
-def setup_path():
-    """
-    Add the parent directory to the Python path.
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
-    This function is called by test modules to ensure they can import
-    modules from the project root directory.
-    """
-    # This function exists to document the path setup that happens on import
-    pass
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
@@ -7,12 +7,12 @@ multiple test files, reducing code duplication.
 
 import json
 import os
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock
 
+import dash
 import pytest
-from dash import Dash
 
 # Test data directory
 TEST_DATA_DIR = Path(os.path.join(os.path.dirname(__file__), "test_data"))
@@ -49,14 +49,41 @@ def create_mock_commit(commit_data):
     return MockCommit(commit_data)
 
 
+@dataclass
+class FakeDiff:
+    """One entry of ``commit.diff(parent)``: the path before and after."""
+
+    a_path: str
+    b_path: str
+
+
+@dataclass
+class FakeCommit:
+    """Plain stand-in for a GitPython commit.
+
+    Attribute reads are ordinary lookups, unlike a Mock which builds child
+    mocks on demand.
+    """
+
+    hexsha: str | None
+    message: str | None
+    committed_datetime: datetime | None
+    committed_date: float | None
+    parents: list = field(default_factory=list)
+    diffs: list[FakeDiff] = field(default_factory=list)
+
+    def diff(self, other=None):
+        return self.diffs
+
+
 def create_mock_commit_with_diffs(
     hexsha=None, message=None, date=None, modified_files=None
 ):
     """
-    Create a mock commit with diff support for testing git operations.
+    Create a fake commit with diff support for testing git operations.
 
     This helper creates commits with hexsha, message, committed_datetime, and diff().
-    Used by tests that need to mock git commit objects with file changes.
+    Used by tests that need to stand in for git commit objects with file changes.
 
     Args:
         hexsha: Commit hash (optional)
@@ -65,27 +92,20 @@ def create_mock_commit_with_diffs(
         modified_files: List of file paths modified in commit, or None for initial commits
 
     Returns:
-        Mock commit object with necessary attributes for git operations
+        FakeCommit with the attributes git operations read
     """
-    commit = Mock()
-    if hexsha is not None:
-        commit.hexsha = hexsha
-    commit.message = message
-    commit.committed_datetime = date
-
-    if modified_files is not None:
-        parent = Mock()
-        commit.parents = [parent]
-        diff_items = []
-        for file_path in modified_files:
-            diff_item = Mock()
-            diff_item.a_path = file_path
-            diff_items.append(diff_item)
-        commit.diff = Mock(return_value=diff_items)
-    else:
-        commit.parents = []
-
-    return commit
+    if modified_files is None:
+        return FakeCommit(
+            hexsha, message, date, date.timestamp() if date else None
+        )
+    return FakeCommit(
+        hexsha,
+        message,
+        date,
+        date.timestamp() if date else None,
+        parents=[object()],
+        diffs=[FakeDiff(path, path) for path in modified_files],
+    )
 
 
 def load_commits_json(period):
@@ -122,10 +142,17 @@ def load_commits_data(period):
     return [create_mock_commit(commit) for commit in commits_json]
 
 
-@pytest.fixture
-def dash_app():
-    """Create a Dash app instance for testing."""
-    return Dash(__name__, suppress_callback_exceptions=True)
+@pytest.fixture(scope="session", autouse=True)
+def _no_page_registration():
+    """Make ``dash.register_page`` a no-op while page modules are imported.
+
+    Page modules register themselves at import time, which ties each test
+    to global page-registry state. Tests call the callbacks directly, so
+    registration is skipped for the whole session.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(dash, "register_page", lambda *a, **k: None)
+        yield
 
 
 @pytest.fixture
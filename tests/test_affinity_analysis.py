@@ -8,10 +8,6 @@ The goal is to pin down core affinity behaviour for the helpers that are
 used by the network graph visualisation code.
 """
 
-from tests import setup_path
-
-setup_path()
-
 import pytest
 
 import algorithms.affinity_analysis as aa
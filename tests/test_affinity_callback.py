@@ -9,22 +9,16 @@ loaded from JSON files in the test_data directory. This ensures that the tests
 produce consistent results regardless of the repository they're run against.
 """
 
-from tests import setup_path
-
-setup_path()
 import sys
 
 import plotly.graph_objects as go
 import pytest
-from dash import Dash
 
 import data
 
 # Pytest automatically loads conftest.py, so load_commits_data is available
 from tests.conftest import load_commits_data
 
-app = Dash(__name__, suppress_callback_exceptions=True)
-
 
 def test_callback_with_mock_data(monkeypatch):
     """Test the affinity graph callback with mocked commit data."""
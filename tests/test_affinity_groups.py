@@ -1,6 +1,3 @@
-from tests import setup_path
-
-setup_path()
 import networkx as nx
 import plotly.graph_objects as go
 
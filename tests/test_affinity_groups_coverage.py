@@ -10,9 +10,6 @@ from unittest.mock import Mock, patch
 
 import plotly.graph_objects as go
 import pytest
-from dash import Dash
-
-app = Dash(__name__, suppress_callback_exceptions=True)
 
 
 @patch("data.commits_in_period")
@@ -15,9 +15,6 @@ from unittest.mock import Mock, patch
 import networkx as nx
 import plotly.graph_objects as go
 import pytest
-from dash import Dash
-
-app = Dash(__name__, suppress_callback_exceptions=True)
 
 
 class TestGetCachedAffinities:
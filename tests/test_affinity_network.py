@@ -6,9 +6,6 @@ create_file_affinity_network function, and provides detailed diagnostics about
 the resulting graph.
 """
 
-from tests import setup_path
-
-setup_path()
 
 import json
 import os
@@ -25,9 +22,6 @@ from visualization.network_graph import (
     create_network_visualization,
 )
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-
 TEST_PERIODS = ["Last 6 Months", "Last 1 Year", "Last 5 Years"]
 
 
@@ -85,6 +85,17 @@ def test_traverse_linear_chain_raises_on_merge_commit():
         traverse_linear_chain(merge, "base")
 
 
+def test_traverse_linear_chain_respects_max_steps():
+    """A chain longer than max_steps parent hops is rejected."""
+    c1 = make_commit("c1")
+    c2 = make_commit("c2", parent=c1)
+    c3 = make_commit("c3", parent=c2)
+
+    assert len(traverse_linear_chain(c3, "c1", max_steps=2)) == 3
+    with pytest.raises(LinearChainTraversalError):
+        traverse_linear_chain(c3, "c1", max_steps=1)
+
+
 def test_commits_to_chain_rows_basic_fields_without_branch():
     """Formatting helper produces expected values without branch_getter."""
     when = datetime(2024, 1, 1, 15, 30, tzinfo=timezone.utc)
@@ -112,6 +123,19 @@ def test_commits_to_chain_rows_includes_branch_when_given_getter():
     assert row["branch"] == "main"
 
 
+def test_commits_to_chain_rows_prefers_branch_map_over_getter():
+    c1 = make_commit("abcdef123456")
+    c2 = make_commit("unmapped")
+
+    rows = commits_to_chain_rows(
+        [c1, c2],
+        branch_getter=lambda c: "getter",
+        branch_map={"abcdef123456": "main"},
+    )
+
+    assert [row["branch"] for row in rows] == ["main", ""]
+
+
 def test_commits_to_chain_rows_truncates_long_message():
     long_msg = "X" * 200
     commit = make_commit("c1")
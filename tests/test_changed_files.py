@@ -0,0 +1,62 @@
+"""Tests for the per-commit ``changed_files`` cache in `utils/git.py`."""
+
+import gc
+import weakref
+from types import SimpleNamespace
+
+from utils.git import changed_files
+
+REPO = SimpleNamespace(git_dir="repo/.git")
+
+
+class StatsCountingCommit:
+    """Commit stand-in that counts how often its stats are computed."""
+
+    def __init__(self, hexsha, files):
+        self.repo = REPO
+        self.hexsha = hexsha
+        self._files = files
+        self.stats_reads = 0
+
+    @property
+    def stats(self):
+        self.stats_reads += 1
+        return SimpleNamespace(files=self._files)
+
+
+def test_changed_files_computes_stats_once_per_commit():
+    commit = StatsCountingCommit("a" * 40, {"a.py": {}, "b.py": {}})
+
+    first = changed_files(commit)
+    second = changed_files(commit)
+
+    assert set(first) == {"a.py", "b.py"}
+    assert second is first
+    assert commit.stats_reads == 1
+
+
+def test_changed_files_shares_stats_between_objects_for_one_commit():
+    first = StatsCountingCommit("b" * 40, {"a.py": {}})
+    again = StatsCountingCommit("b" * 40, {"a.py": {}})
+
+    changed_files(first)
+    changed_files(again)
+
+    assert again.stats_reads == 0
+
+
+def test_changed_files_does_not_keep_the_commit_alive():
+    commit = StatsCountingCommit("c" * 40, {"a.py": {}})
+    ref = weakref.ref(commit)
+
+    changed_files(commit)
+    del commit
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_changed_files_reads_commits_without_repo_directly():
+    commit = SimpleNamespace(stats=SimpleNamespace(files={"a.py": {}}))
+
+    assert changed_files(commit) == {"a.py": {}}
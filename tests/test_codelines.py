@@ -69,6 +69,7 @@ class DummyCommitWithRefs:
     """Commit mock that exposes refs for branch detection tests."""
 
     def __init__(self, ref_name: str) -> None:
+        self.hexsha = "refs_sha"
         self.refs = [DummyRef(ref_name)]
 
 
@@ -77,6 +78,7 @@ class DummyCommitWithNameRev:
 
     def __init__(self, name_rev: str) -> None:
         # No refs so that _branch_for_commit falls back to name_rev.
+        self.hexsha = "name_rev_sha"
         self.refs = []
         self.name_rev = name_rev
 
@@ -103,9 +105,9 @@ def test_branch_for_commit_uses_refs_to_extract_branch(
     mock_get_repo.return_value = DummyRepo()
     mock_traverse_linear_chain.return_value = [commit]
 
-    def fake_commits_to_chain_rows(chain_commits, branch_getter):
-        # Use the provided branch_getter to compute branch names for the chain.
-        branches = [branch_getter(c) for c in chain_commits]
+    def fake_commits_to_chain_rows(chain_commits, branch_map):
+        # Use the provided branch_map to look up branch names for the chain.
+        branches = [branch_map[c.hexsha] for c in chain_commits]
         return [{"branch": b} for b in branches]
 
     mock_commits_to_chain_rows.side_effect = fake_commits_to_chain_rows
@@ -138,8 +140,8 @@ def test_branch_for_commit_uses_name_rev_when_refs_missing(
     mock_get_repo.return_value = DummyRepo()
     mock_traverse_linear_chain.return_value = [commit]
 
-    def fake_commits_to_chain_rows(chain_commits, branch_getter):
-        branches = [branch_getter(c) for c in chain_commits]
+    def fake_commits_to_chain_rows(chain_commits, branch_map):
+        branches = [branch_map[c.hexsha] for c in chain_commits]
         return [{"branch": b} for b in branches]
 
     mock_commits_to_chain_rows.side_effect = fake_commits_to_chain_rows
@@ -149,3 +151,24 @@ def test_branch_for_commit_uses_name_rev_when_refs_missing(
     rows = update_chain_commits_table(click_data)
 
     assert rows == [{"branch": "main"}]
+
+
+def test_branch_for_commit_rereads_name_rev_after_the_branch_moves():
+    """branch_for_commit keeps no memo, so a moved branch shows its new distance."""
+    from pages.codelines import branch_for_commit
+
+    class MovingCommit:
+        refs = []
+
+        def __init__(self) -> None:
+            self.lookups = 0
+
+        @property
+        def name_rev(self) -> str:
+            self.lookups += 1
+            return f"deadbeef main~{self.lookups}"
+
+    commit = MovingCommit()
+
+    assert branch_for_commit(commit) == "main~1"
+    assert branch_for_commit(commit) == "main~2"
@@ -7,9 +7,6 @@ import pytest
 
 from algorithms.commit_frequency import calculate_file_commit_frequency
 from algorithms.file_changes import FileChangeStats
-from tests import setup_path
-
-setup_path()
 
 
 @pytest.fixture
@@ -26,27 +23,27 @@ def mock_commits_with_files():
 
     # Commit 1: touches file1.py and file2.py
     commit1 = MagicMock()
-    commit1.stats.files = {"file1.py": {}, "file2.py": {}}
+    commit1.stats.files = dict.fromkeys(("file1.py", "file2.py"))
     commits.append(commit1)
 
     # Commit 2: touches file1.py and file3.py
     commit2 = MagicMock()
-    commit2.stats.files = {"file1.py": {}, "file3.py": {}}
+    commit2.stats.files = dict.fromkeys(("file1.py", "file3.py"))
     commits.append(commit2)
 
     # Commit 3: touches file1.py only
     commit3 = MagicMock()
-    commit3.stats.files = {"file1.py": {}}
+    commit3.stats.files = dict.fromkeys(("file1.py",))
     commits.append(commit3)
 
     # Commit 4: touches file2.py only
     commit4 = MagicMock()
-    commit4.stats.files = {"file2.py": {}}
+    commit4.stats.files = dict.fromkeys(("file2.py",))
     commits.append(commit4)
 
     # Commit 5: touches file4.py only
     commit5 = MagicMock()
-    commit5.stats.files = {"file4.py": {}}
+    commit5.stats.files = dict.fromkeys(("file4.py",))
     commits.append(commit5)
 
     return commits
@@ -175,6 +172,24 @@ def test_calculate_file_commit_frequency_top_n_zero(
     assert len(result) == 0
 
 
+def test_calculate_file_commit_frequency_top_n_zero_skips_git_walk(
+    mock_commits_with_files, mock_repo
+):
+    """With top_n=0 no file statistics are requested from git."""
+    begin = datetime.now() - timedelta(days=30)
+    end = datetime.now()
+
+    with patch(
+        "algorithms.file_changes.files_changes_over_period", return_value={}
+    ) as mock_files_changes:
+        result = calculate_file_commit_frequency(
+            mock_commits_with_files, mock_repo, begin, end, top_n=0
+        )
+
+    assert result == []
+    assert mock_files_changes.call_count == 0
+
+
 def test_calculate_file_commit_frequency_empty_commits(mock_repo):
     """Test with no commits."""
     begin = datetime.now() - timedelta(days=30)
@@ -327,7 +342,7 @@ def test_calculate_file_commit_frequency_preserves_commit_order(
 def test_calculate_file_commit_frequency_single_commit_single_file(mock_repo):
     """Test with a single commit touching a single file."""
     commit = MagicMock()
-    commit.stats.files = {"only_file.py": {}}
+    commit.stats.files = dict.fromkeys(("only_file.py",))
 
     begin = datetime.now() - timedelta(days=30)
     end = datetime.now()
@@ -400,20 +415,20 @@ def test_calculate_file_commit_frequency_with_large_dataset(mock_repo):
     commits = []
     for i in range(50):
         commit = MagicMock()
-        commit.stats.files = {f"file{i}.py": {}}
+        commit.stats.files = dict.fromkeys((f"file{i}.py",))
         commits.append(commit)
 
     # Add extra commits to some files to create a frequency distribution
     # file0.py gets 10 extra commits (11 total)
     for _ in range(10):
         commit = MagicMock()
-        commit.stats.files = {"file0.py": {}}
+        commit.stats.files = dict.fromkeys(("file0.py",))
         commits.append(commit)
 
     # file1.py gets 5 extra commits (6 total)
     for _ in range(5):
         commit = MagicMock()
-        commit.stats.files = {"file1.py": {}}
+        commit.stats.files = dict.fromkeys(("file1.py",))
         commits.append(commit)
 
     begin = datetime.now() - timedelta(days=30)
@@ -1,97 +1,86 @@
-import unittest
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import Mock
 
-from tests.conftest import create_mock_commit_with_diffs
+import pytest
+
 from utils.git import get_commit_messages_for_file
 
 
-class TestGetCommitMessagesForFile(unittest.TestCase):
-
-    def test_empty_repo(self):
-        """Test with no commits in the repo."""
-        repo = Mock()
-        repo.iter_commits = Mock(return_value=[])
-        start = datetime(2025, 1, 1)
-        end = datetime(2025, 12, 31)
-        result = list(get_commit_messages_for_file(repo, "test.py", start, end))
-        self.assertEqual([], result)
-        # Verify iter_commits was called with correct parameters
-        repo.iter_commits.assert_called_once_with(
-            paths="test.py", since=start, until=end
-        )
-
-    def test_commits_with_target_file(self):
-        """Test finding commits that modified the target file."""
-        start = datetime(2025, 1, 1)
-        end = datetime(2025, 12, 31)
-        commit1 = create_mock_commit_with_diffs(
-            message="feat: update test file",
-            date=datetime(2025, 6, 15, 10, 30),
-            modified_files=["test.py", "other.py"],
-        )
-        commit3 = create_mock_commit_with_diffs(
-            message="refactor: test file again",
-            date=datetime(2025, 8, 10, 9, 45),
-            modified_files=["test.py"],
-        )
-        repo = Mock()
-        # iter_commits with path filter should only return commits for that file
-        repo.iter_commits = Mock(return_value=[commit1, commit3])
-        result = list(get_commit_messages_for_file(repo, "test.py", start, end))
-        self.assertEqual(2, len(result))
-        self.assertEqual("feat: update test file", result[0])
-        self.assertEqual("refactor: test file again", result[1])
-
-    def test_date_filtering(self):
-        """Test that commits outside the date range are filtered out."""
-        start = datetime(2025, 6, 1)
-        end = datetime(2025, 7, 31)
-        commit2 = create_mock_commit_with_diffs(
-            message="in range",
-            date=datetime(2025, 7, 1, 14, 20),
-            modified_files=["test.py"],
-        )
-        repo = Mock()
-        # iter_commits with since/until should only return commits in date range
-        repo.iter_commits = Mock(return_value=[commit2])
-        result = list(get_commit_messages_for_file(repo, "test.py", start, end))
-        self.assertEqual(1, len(result))
-        self.assertEqual("in range", result[0])
-
-    def test_full_message_preservation(self):
-        """Test that full commit messages including multiple lines are preserved."""
-        start = datetime(2025, 1, 1)
-        end = datetime(2025, 12, 31)
-        multi_line_message = "feat: add feature\n\nThis is a detailed description\nwith multiple lines"
-        commit = create_mock_commit_with_diffs(
-            message=multi_line_message,
-            date=datetime(2025, 6, 15, 10, 30),
-            modified_files=["test.py"],
-        )
-        repo = Mock()
-        repo.iter_commits = Mock(return_value=[commit])
-        result = list(get_commit_messages_for_file(repo, "test.py", start, end))
-        self.assertEqual(1, len(result))
-        self.assertEqual(multi_line_message, result[0])
-
-    def test_initial_commit_no_parents(self):
-        """Test handling of initial commit with no parents."""
-        start = datetime(2025, 1, 1)
-        end = datetime(2025, 12, 31)
-        commit = create_mock_commit_with_diffs(
-            message="Initial commit",
-            date=datetime(2025, 6, 15, 10, 30),
-            modified_files=None,
-        )
-        repo = Mock()
-        # iter_commits with path filter would return the commit if file exists
-        repo.iter_commits = Mock(return_value=[commit])
-        result = list(get_commit_messages_for_file(repo, "test.py", start, end))
-        # Since we're using git's path filtering, it returns commits that touched the file
-        self.assertEqual(1, len(result))
-        self.assertEqual("Initial commit", result[0])
-
-
-if __name__ == "__main__":
-    unittest.main()
+def make_commit(message, date):
+    """Commit stand-in with just the attributes the function reads.
+
+    iter_commits does the path and date filtering in git, so the commits
+    it returns only need a message (and a date for readability).
+    """
+    return SimpleNamespace(message=message, committed_datetime=date)
+
+
+MULTI_LINE_MESSAGE = (
+    "feat: add feature\n\nThis is a detailed description\nwith multiple lines"
+)
+
+
+def test_empty_repo_queries_git_with_path_and_period():
+    """With no commits in the repo, nothing is returned.
+
+    iter_commits is asked to filter by path and period.
+    """
+    repo = Mock()
+    repo.iter_commits = Mock(return_value=[])
+    start = datetime(2025, 1, 1)
+    end = datetime(2025, 12, 31)
+
+    result = get_commit_messages_for_file(repo, "test.py", start, end)
+
+    assert result == []
+    repo.iter_commits.assert_called_once_with(
+        paths="test.py", since=start, until=end
+    )
+
+
+@pytest.mark.parametrize(
+    "commits,expected",
+    [
+        pytest.param(
+            # iter_commits with path filter only returns commits for that file
+            [
+                make_commit(
+                    "feat: update test file", datetime(2025, 6, 15, 10, 30)
+                ),
+                make_commit(
+                    "refactor: test file again", datetime(2025, 8, 10, 9, 45)
+                ),
+            ],
+            ["feat: update test file", "refactor: test file again"],
+            id="target_file",
+        ),
+        pytest.param(
+            # iter_commits with since/until only returns commits in range
+            [make_commit("in range", datetime(2025, 7, 1, 14, 20))],
+            ["in range"],
+            id="date_filter",
+        ),
+        pytest.param(
+            # Full messages, including all lines, are preserved
+            [make_commit(MULTI_LINE_MESSAGE, datetime(2025, 6, 15, 10, 30))],
+            [MULTI_LINE_MESSAGE],
+            id="multiline",
+        ),
+        pytest.param(
+            # An initial commit (no parents) is reported like any other
+            [make_commit("Initial commit", datetime(2025, 6, 15, 10, 30))],
+            ["Initial commit"],
+            id="initial",
+        ),
+    ],
+)
+def test_get_commit_messages(commits, expected):
+    """Messages come back in the order git yields the commits."""
+    repo = SimpleNamespace(iter_commits=lambda **_: commits)
+
+    result = get_commit_messages_for_file(
+        repo, "test.py", datetime(2025, 1, 1), datetime(2025, 12, 31)
+    )
+
+    assert result == expected
@@ -1,16 +1,37 @@
-from tests import setup_path
+"""
+Verify that the Dash components used by the application import and build.
 
-setup_path()
-"\nTest script to verify that Dash imports work correctly with the new version.\nThis script imports the same Dash components used in the application.\n"
-try:
-    import dash
+These used to run as a module-level probe wrapped in ``try/except: pass``,
+which hid failures. They are now real tests, and the probe app is built
+once per module. Only the install check avoids importing Dash; the rest
+are marked slow so quick runs can skip them with ``-m "not slow"``.
+"""
+
+from importlib.util import find_spec
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def probe_app():
+    """A minimal Dash app with the component types the pages rely on."""
+    from dash import Dash, dcc, html
+
+    app = Dash(__name__)
+    app.layout = html.Div([html.H1("Test App"), dcc.Graph(id="test-graph")])
+    return app
+
+
+def test_dash_is_installed():
+    assert find_spec("dash") is not None
+
+
+@pytest.mark.slow
+def test_dash_components_import():
     from dash import (
-        Dash,
         Input,
         Output,
         callback,
-        dcc,
-        html,
         page_container,
         page_registry,
         register_page,
@@ -18,7 +39,22 @@ try:
     from dash.dash_table import DataTable
     from dash.dcc import Dropdown, Graph
 
-    app = Dash(__name__)
-    app.layout = html.Div([html.H1("Test App"), dcc.Graph(id="test-graph")])
-except Exception as e:
-    pass
+    assert all(
+        component is not None
+        for component in (
+            Input,
+            Output,
+            callback,
+            page_container,
+            page_registry,
+            register_page,
+            DataTable,
+            Dropdown,
+            Graph,
+        )
+    )
+
+
+@pytest.mark.slow
+def test_dash_app_builds_with_layout(probe_app):
+    assert probe_app.layout is not None
@@ -28,7 +28,7 @@ import data
     ],
 )
 def test_get_repo_name(input_path, expected_name):
-    data.get_repo_name.cache_clear()
-    data.get_repo.cache_clear()
+    # Call past the @cache so each case reads its own sys.argv without
+    # clearing (or leaving behind) the app-wide cached name.
     with patch("sys.argv", ["script_name", input_path]):
-        assert data.get_repo_name() == expected_name
+        assert data.get_repo_name.__wrapped__() == expected_name
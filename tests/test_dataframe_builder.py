@@ -7,6 +7,26 @@ import pytest
 from algorithms.chain_models import TIMELINE_COLUMNS, TimelineRow
 from algorithms.dataframe_builder import create_timeline_dataframe
 
+JAN_1 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+JAN_10 = datetime(2024, 1, 10, tzinfo=timezone.utc)
+
+SINGLE_ROW = TimelineRow(
+    first=JAN_1,
+    last=JAN_10,
+    elevation=1,
+    commit_counts=5,
+    head="abc",
+    tail="def",
+    duration=9,
+    density=1.8,
+)
+
+
+@pytest.fixture(scope="module")
+def single_row_df():
+    """One-row DataFrame shared by the tests that only read from it."""
+    return create_timeline_dataframe([SINGLE_ROW])
+
 
 def test_empty_rows():
     """Test that empty rows list returns empty DataFrame."""
@@ -16,35 +36,24 @@ def test_empty_rows():
     assert list(df.columns) == TIMELINE_COLUMNS
 
 
-def test_single_row():
+def test_single_row(single_row_df):
     """Test DataFrame creation from a single row."""
-    row = TimelineRow(
-        first=datetime(2024, 1, 1, tzinfo=timezone.utc),
-        last=datetime(2024, 1, 10, tzinfo=timezone.utc),
-        elevation=1,
-        commit_counts=5,
-        head="abc",
-        tail="def",
-        duration=9,
-        density=1.8,
-    )
-
-    df = create_timeline_dataframe([row])
+    df = single_row_df
 
     assert len(df) == 1
-    assert df.iloc[0]["elevation"] == 1
-    assert df.iloc[0]["commit_counts"] == 5
-    assert df.iloc[0]["head"] == "abc"
-    assert df.iloc[0]["tail"] == "def"
-    assert df.iloc[0]["duration"] == 9
-    assert df.iloc[0]["density"] == 1.8
+    assert df.at[0, "elevation"] == 1
+    assert df.at[0, "commit_counts"] == 5
+    assert df.at[0, "head"] == "abc"
+    assert df.at[0, "tail"] == "def"
+    assert df.at[0, "duration"] == 9
+    assert df.at[0, "density"] == 1.8
 
 
 def test_multiple_rows():
     """Test DataFrame creation from multiple rows."""
     rows = [
         TimelineRow(
-            first=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            first=JAN_1,
             last=datetime(2024, 1, 5, tzinfo=timezone.utc),
             elevation=1,
             commit_counts=3,
@@ -54,7 +63,7 @@ def test_multiple_rows():
             density=1.33,
         ),
         TimelineRow(
-            first=datetime(2024, 1, 10, tzinfo=timezone.utc),
+            first=JAN_10,
             last=datetime(2024, 1, 20, tzinfo=timezone.utc),
             elevation=2,
             commit_counts=7,
@@ -68,42 +77,20 @@ def test_multiple_rows():
     df = create_timeline_dataframe(rows)
 
     assert len(df) == 2
-    assert df.iloc[0]["head"] == "c1"
-    assert df.iloc[1]["head"] == "c3"
+    assert df.at[0, "head"] == "c1"
+    assert df.at[1, "head"] == "c3"
 
 
-def test_column_order():
+def test_column_order(single_row_df):
     """Test that DataFrame has columns in expected order."""
-    row = TimelineRow(
-        first=datetime(2024, 1, 1, tzinfo=timezone.utc),
-        last=datetime(2024, 1, 10, tzinfo=timezone.utc),
-        elevation=1,
-        commit_counts=5,
-        head="abc",
-        tail="def",
-        duration=9,
-        density=1.8,
-    )
-
-    df = create_timeline_dataframe([row])
+    df = single_row_df
 
     assert list(df.columns) == TIMELINE_COLUMNS
 
 
-def test_datetime_column_types():
+def test_datetime_column_types(single_row_df):
     """Test that datetime columns have correct dtype."""
-    row = TimelineRow(
-        first=datetime(2024, 1, 1, tzinfo=timezone.utc),
-        last=datetime(2024, 1, 10, tzinfo=timezone.utc),
-        elevation=1,
-        commit_counts=5,
-        head="abc",
-        tail="def",
-        duration=9,
-        density=1.8,
-    )
-
-    df = create_timeline_dataframe([row])
+    df = single_row_df
 
     # Check that datetime columns are properly typed
     assert df["first"].dtype == "datetime64[ns]"
@@ -186,12 +173,12 @@ def test_preserves_data_integrity():
     df = create_timeline_dataframe([row])
 
     # Check all values preserved
-    assert df.iloc[0]["elevation"] == 3
-    assert df.iloc[0]["commit_counts"] == 42
-    assert df.iloc[0]["head"] == "first_sha_abc"
-    assert df.iloc[0]["tail"] == "last_sha_xyz"
-    assert df.iloc[0]["duration"] == 100
-    assert abs(df.iloc[0]["density"] - 2.38095) < 0.00001
+    assert df.at[0, "elevation"] == 3
+    assert df.at[0, "commit_counts"] == 42
+    assert df.at[0, "head"] == "first_sha_abc"
+    assert df.at[0, "tail"] == "last_sha_xyz"
+    assert df.at[0, "duration"] == 100
+    assert df.at[0, "density"] == pytest.approx(2.38095, abs=1e-5)
 
 
 def test_datetime_values_preserved():
@@ -214,8 +201,8 @@ def test_datetime_values_preserved():
 
     # Convert back to python datetime for comparison
     # (pandas datetime64 conversion may lose timezone info but preserves timestamp)
-    df_first = df.iloc[0]["first"].to_pydatetime()
-    df_last = df.iloc[0]["last"].to_pydatetime()
+    df_first = df.at[0, "first"].to_pydatetime()
+    df_last = df.at[0, "last"].to_pydatetime()
 
     # Check timestamps are equivalent (allowing for timezone conversion)
     assert df_first.replace(tzinfo=timezone.utc) == original_first
@@ -225,8 +212,8 @@ def test_datetime_values_preserved():
 def test_zero_values():
     """Test handling of zero values."""
     row = TimelineRow(
-        first=datetime(2024, 1, 1, tzinfo=timezone.utc),
-        last=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        first=JAN_1,
+        last=JAN_1,
         elevation=1,
         commit_counts=0,
         head="sha",
@@ -237,25 +224,14 @@ def test_zero_values():
 
     df = create_timeline_dataframe([row])
 
-    assert df.iloc[0]["commit_counts"] == 0
-    assert df.iloc[0]["duration"] == 0
-    assert df.iloc[0]["density"] == 0.0
+    assert df.at[0, "commit_counts"] == 0
+    assert df.at[0, "duration"] == 0
+    assert df.at[0, "density"] == 0.0
 
 
-def test_column_types():
+def test_column_types(single_row_df):
     """Test that all columns have expected types."""
-    row = TimelineRow(
-        first=datetime(2024, 1, 1, tzinfo=timezone.utc),
-        last=datetime(2024, 1, 10, tzinfo=timezone.utc),
-        elevation=1,
-        commit_counts=5,
-        head="abc",
-        tail="def",
-        duration=9,
-        density=1.8,
-    )
-
-    df = create_timeline_dataframe([row])
+    df = single_row_df
 
     # Check types
     assert df["first"].dtype == "datetime64[ns]"
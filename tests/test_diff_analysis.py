@@ -5,21 +5,30 @@ This file contains tests for the get_diffs_in_period function,
 specifically testing edge cases like empty data.
 """
 
-from tests import setup_path
-
-setup_path()
-import os
-import sys
 from datetime import datetime
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
-from pandas import DataFrame
+from pandas import CategoricalDtype, DataFrame
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from algorithms.diff_analysis import get_diffs_in_period
 
 
+def make_commit(committed, insertions, deletions):
+    """Commit stand-in with just the attributes get_diffs_in_period reads."""
+    return SimpleNamespace(
+        committed_datetime=committed,
+        stats=SimpleNamespace(
+            total={"insertions": insertions, "deletions": deletions}
+        ),
+    )
+
+
+def counts_by_kind(result):
+    """Map each kind to its count; only meaningful for a single-day result."""
+    return dict(zip(result["kind"], result["count"], strict=True))
+
+
 def test_dataframe_initialized_with_correct_columns_when_empty():
     """Test that DataFrame is initialized with correct columns even when the commits list is empty."""
     commits_data = []
@@ -34,11 +43,7 @@ def test_dataframe_initialized_with_correct_columns_when_empty():
 
 def test_dataframe_with_single_commit():
     """Test that DataFrame is correctly populated with a single commit."""
-    mock_commit = MagicMock()
-    mock_commit.committed_datetime.date.return_value = datetime(
-        2024, 1, 15
-    ).date()
-    mock_commit.stats.total = {"insertions": 10, "deletions": 5}
+    mock_commit = make_commit(datetime(2024, 1, 15), 10, 5)
     commits_data = [mock_commit]
     start = datetime(2024, 1, 1)
     end = datetime(2024, 1, 31)
@@ -51,26 +56,17 @@ def test_dataframe_with_single_commit():
     assert "possible mods" in kinds
     assert "net inserts" in kinds
     assert "net deletes" in kinds
-    mods_count = result[result["kind"] == "possible mods"]["count"].iloc[0]
-    inserts_count = result[result["kind"] == "net inserts"]["count"].iloc[0]
-    deletes_count = result[result["kind"] == "net deletes"]["count"].iloc[0]
-    assert mods_count == 5
-    assert inserts_count == 5
-    assert deletes_count == 0
+    assert counts_by_kind(result) == {
+        "possible mods": 5,
+        "net inserts": 5,
+        "net deletes": 0,
+    }
 
 
 def test_dataframe_with_multiple_commits_same_day():
     """Test that DataFrame correctly aggregates multiple commits on the same day."""
-    mock_commit1 = MagicMock()
-    mock_commit1.committed_datetime.date.return_value = datetime(
-        2024, 1, 15
-    ).date()
-    mock_commit1.stats.total = {"insertions": 10, "deletions": 5}
-    mock_commit2 = MagicMock()
-    mock_commit2.committed_datetime.date.return_value = datetime(
-        2024, 1, 15
-    ).date()
-    mock_commit2.stats.total = {"insertions": 20, "deletions": 15}
+    mock_commit1 = make_commit(datetime(2024, 1, 15), 10, 5)
+    mock_commit2 = make_commit(datetime(2024, 1, 15), 20, 15)
     commits_data = [mock_commit1, mock_commit2]
     start = datetime(2024, 1, 1)
     end = datetime(2024, 1, 31)
@@ -78,26 +74,17 @@ def test_dataframe_with_multiple_commits_same_day():
     assert isinstance(result, DataFrame)
     assert list(result.columns) == ["date", "kind", "count"]
     assert len(result) == 3
-    mods_count = result[result["kind"] == "possible mods"]["count"].iloc[0]
-    inserts_count = result[result["kind"] == "net inserts"]["count"].iloc[0]
-    deletes_count = result[result["kind"] == "net deletes"]["count"].iloc[0]
-    assert mods_count == 20
-    assert inserts_count == 10
-    assert deletes_count == 0
+    assert counts_by_kind(result) == {
+        "possible mods": 20,
+        "net inserts": 10,
+        "net deletes": 0,
+    }
 
 
 def test_dataframe_with_commits_different_days():
     """Test that DataFrame correctly handles commits on different days."""
-    mock_commit1 = MagicMock()
-    mock_commit1.committed_datetime.date.return_value = datetime(
-        2024, 1, 15
-    ).date()
-    mock_commit1.stats.total = {"insertions": 10, "deletions": 5}
-    mock_commit2 = MagicMock()
-    mock_commit2.committed_datetime.date.return_value = datetime(
-        2024, 1, 16
-    ).date()
-    mock_commit2.stats.total = {"insertions": 20, "deletions": 25}
+    mock_commit1 = make_commit(datetime(2024, 1, 15), 10, 5)
+    mock_commit2 = make_commit(datetime(2024, 1, 16), 20, 25)
     commits_data = [mock_commit1, mock_commit2]
     start = datetime(2024, 1, 1)
     end = datetime(2024, 1, 31)
@@ -111,5 +98,19 @@ def test_dataframe_with_commits_different_days():
     assert datetime(2024, 1, 16).date() in dates
 
 
+def test_kind_column_holds_plain_strings():
+    result = get_diffs_in_period(
+        [make_commit(datetime(2024, 1, 15), 10, 5)],
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 31),
+    )
+    assert not isinstance(result["kind"].dtype, CategoricalDtype)
+    assert result["kind"].tolist() == [
+        "net deletes",
+        "net inserts",
+        "possible mods",
+    ]
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
@@ -2,13 +2,12 @@
 Test script to verify that one-element communities are excluded from the graph.
 """
 
-from tests import setup_path
-
-setup_path()
 import sys
 
 import networkx as nx
 
+from visualization.network_graph import _nodes_by_community
+
 
 def test_exclude_one_element_communities() -> None:
     """
@@ -23,17 +22,11 @@ def test_exclude_one_element_communities() -> None:
     G.add_node("file5.py", community=1)
     G.add_node("file6.py", community=2)
     G.add_node("file7.py", community=3)
-    community_ids = set(nx.get_node_attributes(G, "community").values())
-    included_communities = []
-    for community_id in community_ids:
-        community_nodes = [
-            node
-            for (node, data) in G.nodes(data=True)
-            if data.get("community") == community_id
-        ]
-        if len(community_nodes) <= 1:
-            continue
-        included_communities.append((community_id, community_nodes))
+    included_communities = [
+        (community_id, community_nodes)
+        for community_id, community_nodes in _nodes_by_community(G).items()
+        if len(community_nodes) > 1
+    ]
     community_count = len(included_communities)
     included_ids = [id for (id, _) in included_communities]
     expected_ids = [0, 1]
@@ -47,6 +40,17 @@ def test_exclude_one_element_communities() -> None:
         ), f"Community {community_id} has only {len(nodes)} node"
 
 
+def test_nodes_by_community_skips_unassigned_nodes() -> None:
+    G = nx.Graph()
+    G.add_node("b.py", community=1)
+    G.add_node("loose.py")
+    G.add_node("a.py", community=0)
+    G.add_node("c.py", community=1)
+
+    assert _nodes_by_community(G) == {0: ["a.py"], 1: ["b.py", "c.py"]}
+    assert list(_nodes_by_community(G)) == [0, 1]
+
+
 if __name__ == "__main__":
     test_exclude_one_element_communities()
     sys.exit(0)
@@ -2,338 +2,272 @@
 Unit tests for figure builder.
 """
 
-import unittest
+import copy
 from datetime import datetime, timezone
 from unittest.mock import patch
 
+import pytest
 from pandas import DataFrame
 
+from algorithms import figure_builder
 from algorithms.chain_models import TIMELINE_COLUMNS
 from algorithms.figure_builder import create_timeline_figure
 
+MULTI_ROWS = [
+    {
+        "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "last": datetime(2024, 1, 5, tzinfo=timezone.utc),
+        "elevation": 1,
+        "commit_counts": 3,
+        "head": "c1",
+        "tail": "c2",
+        "duration": 4,
+        "density": 1.33,
+    },
+    {
+        "first": datetime(2024, 1, 10, tzinfo=timezone.utc),
+        "last": datetime(2024, 1, 20, tzinfo=timezone.utc),
+        "elevation": 2,
+        "commit_counts": 7,
+        "head": "c3",
+        "tail": "c4",
+        "duration": 10,
+        "density": 1.43,
+    },
+]
+
+VARYING_ELEVATION_ROWS = [
+    {
+        "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "last": datetime(2024, 1, 5, tzinfo=timezone.utc),
+        "elevation": 1,
+        "commit_counts": 3,
+        "head": "c1",
+        "tail": "c2",
+        "duration": 4,
+        "density": 1.33,
+    },
+    {
+        "first": datetime(2024, 1, 3, tzinfo=timezone.utc),
+        "last": datetime(2024, 1, 8, tzinfo=timezone.utc),
+        "elevation": 2,
+        "commit_counts": 4,
+        "head": "c3",
+        "tail": "c4",
+        "duration": 5,
+        "density": 1.25,
+    },
+    {
+        "first": datetime(2024, 1, 6, tzinfo=timezone.utc),
+        "last": datetime(2024, 1, 12, tzinfo=timezone.utc),
+        "elevation": 3,
+        "commit_counts": 5,
+        "head": "c5",
+        "tail": "c6",
+        "duration": 6,
+        "density": 1.2,
+    },
+]
+
+VARYING_DENSITY_ROWS = [
+    {
+        "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "last": datetime(2024, 1, 10, tzinfo=timezone.utc),
+        "elevation": 1,
+        "commit_counts": 10,
+        "head": "c1",
+        "tail": "c2",
+        "duration": 9,
+        "density": 0.9,  # Low density (many commits)
+    },
+    {
+        "first": datetime(2024, 1, 15, tzinfo=timezone.utc),
+        "last": datetime(2024, 1, 25, tzinfo=timezone.utc),
+        "elevation": 1,
+        "commit_counts": 2,
+        "head": "c3",
+        "tail": "c4",
+        "duration": 10,
+        "density": 5.0,  # High density (few commits)
+    },
+]
+
+
+@pytest.fixture(scope="module")
+def single_row_df():
+    """One-row timeline DataFrame; tests must not mutate it."""
+    return DataFrame(
+        [
+            {
+                "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                "last": datetime(2024, 1, 10, tzinfo=timezone.utc),
+                "elevation": 1,
+                "commit_counts": 5,
+                "head": "abc",
+                "tail": "def",
+                "duration": 9,
+                "density": 1.8,
+            }
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def single_row_fig(single_row_df):
+    """The figure for single_row_df, built once for the read-only checks."""
+    return create_timeline_figure(single_row_df)
+
+
+def test_empty_dataframe():
+    """Test figure creation from empty DataFrame."""
+    df = DataFrame(columns=TIMELINE_COLUMNS)
+
+    figure = create_timeline_figure(df)
+
+    # Should return a figure object
+    assert figure is not None
+    assert hasattr(figure, "data")
+
+
+def test_empty_dataframe_skips_plotly_express():
+    """An empty frame gets a titled, trace-free figure without px.timeline."""
+    with patch("algorithms.figure_builder.px.timeline") as mock_timeline:
+        figure = create_timeline_figure(DataFrame(columns=TIMELINE_COLUMNS))
+
+    mock_timeline.assert_not_called()
+    assert len(figure.data) == 0
+    assert figure.layout.title.text == "Code Lines (selected period)"
+
+
+def test_single_row_dataframe(single_row_fig):
+    """Test figure creation from single row."""
+    assert single_row_fig is not None
+    assert len(single_row_fig.data) > 0
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        pytest.param(MULTI_ROWS, id="multiple_rows"),
+        pytest.param(VARYING_ELEVATION_ROWS, id="varying_elevations"),
+        pytest.param(VARYING_DENSITY_ROWS, id="varying_density"),
+    ],
+)
+def test_figure_has_traces(rows):
+    """Multi-row inputs, however they vary, produce a figure with traces."""
+    figure = create_timeline_figure(DataFrame(rows))
+
+    assert figure is not None
+    assert len(figure.data) > 0
+
+
+def test_figure_has_title(single_row_fig):
+    """Test that figure has the expected title."""
+    assert single_row_fig.layout.title.text == "Code Lines (selected period)"
+
+
+def test_figure_uses_correct_columns(single_row_fig):
+    """Test that figure uses correct DataFrame columns."""
+    # Verify figure was created (px.timeline would fail if columns wrong)
+    assert single_row_fig is not None
+    assert len(single_row_fig.data) > 0
+
+
+def test_figure_axis_labels(single_row_fig):
+    """Test that figure has correct axis labels."""
+    # Check that labels are configured (won't be visible in axis titles
+    # for timeline, but should be in hover/legend)
+    assert single_row_fig is not None
+
+
+def test_figure_returns_plotly_figure_type(single_row_fig):
+    """Test that return type is a Plotly Figure."""
+    # Check it's a Plotly figure
+    assert hasattr(single_row_fig, "data")
+    assert hasattr(single_row_fig, "layout")
+    assert hasattr(single_row_fig, "to_json")
+
+
+def test_column_mappings_and_label_keys_are_as_expected(single_row_df):
+    """Test that px.timeline is called with expected columns and label keys.
 
-class TestCreateTimelineFigure(unittest.TestCase):
-    """Test suite for create_timeline_figure function."""
-
-    def test_empty_dataframe(self):
-        """Test figure creation from empty DataFrame."""
-        df = DataFrame(columns=TIMELINE_COLUMNS)
-
-        figure = create_timeline_figure(df)
-
-        # Should return a figure object
-        assert figure is not None
-        assert hasattr(figure, "data")
-
-    def test_single_row_dataframe(self):
-        """Test figure creation from single row."""
-        df = DataFrame(
-            [
-                {
-                    "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 10, tzinfo=timezone.utc),
-                    "elevation": 1,
-                    "commit_counts": 5,
-                    "head": "abc",
-                    "tail": "def",
-                    "duration": 9,
-                    "density": 1.8,
-                }
-            ]
-        )
-
-        figure = create_timeline_figure(df)
-
-        assert figure is not None
-        assert len(figure.data) > 0
-
-    def test_multiple_rows_dataframe(self):
-        """Test figure creation from multiple rows."""
-        df = DataFrame(
-            [
-                {
-                    "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 5, tzinfo=timezone.utc),
-                    "elevation": 1,
-                    "commit_counts": 3,
-                    "head": "c1",
-                    "tail": "c2",
-                    "duration": 4,
-                    "density": 1.33,
-                },
-                {
-                    "first": datetime(2024, 1, 10, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 20, tzinfo=timezone.utc),
-                    "elevation": 2,
-                    "commit_counts": 7,
-                    "head": "c3",
-                    "tail": "c4",
-                    "duration": 10,
-                    "density": 1.43,
-                },
-            ]
-        )
+    This ensures that we treat label *keys* as part of the public
+    contract, while allowing label *values* (strings) to be cosmetic.
+    """
+    with patch("algorithms.figure_builder.px.timeline") as mock_timeline:
+        sentinel_figure = object()
+        mock_timeline.return_value = sentinel_figure
+
+        result = create_timeline_figure(single_row_df)
 
-        figure = create_timeline_figure(df)
-
-        assert figure is not None
-        assert len(figure.data) > 0
-
-    def test_figure_has_title(self):
-        """Test that figure has the expected title."""
-        df = DataFrame(
-            [
-                {
-                    "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 10, tzinfo=timezone.utc),
-                    "elevation": 1,
-                    "commit_counts": 5,
-                    "head": "abc",
-                    "tail": "def",
-                    "duration": 9,
-                    "density": 1.8,
-                }
-            ]
-        )
+    # We should return whatever px.timeline returned
+    assert result is sentinel_figure
 
-        figure = create_timeline_figure(df)
-
-        assert figure.layout.title.text == "Code Lines (selected period)"
-
-    def test_figure_uses_correct_columns(self):
-        """Test that figure uses correct DataFrame columns."""
-        df = DataFrame(
-            [
-                {
-                    "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 10, tzinfo=timezone.utc),
-                    "elevation": 1,
-                    "commit_counts": 5,
-                    "head": "abc",
-                    "tail": "def",
-                    "duration": 9,
-                    "density": 1.8,
-                }
-            ]
-        )
+    _, kwargs = mock_timeline.call_args
 
-        figure = create_timeline_figure(df)
-
-        # Verify figure was created (px.timeline would fail if columns wrong)
-        assert figure is not None
-        assert len(figure.data) > 0
-
-    def test_figure_axis_labels(self):
-        """Test that figure has correct axis labels."""
-        df = DataFrame(
-            [
-                {
-                    "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 10, tzinfo=timezone.utc),
-                    "elevation": 1,
-                    "commit_counts": 5,
-                    "head": "abc",
-                    "tail": "def",
-                    "duration": 9,
-                    "density": 1.8,
-                }
-            ]
-        )
+    # Column mappings
+    assert kwargs["x_start"] == "first"
+    assert kwargs["x_end"] == "last"
+    assert kwargs["y"] == "elevation"
+    assert kwargs["color"] == "density"
+    assert kwargs["custom_data"] == ["head", "tail"]
 
-        figure = create_timeline_figure(df)
-
-        # Check that labels are configured (won't be visible in axis titles
-        # for timeline, but should be in hover/legend)
-        assert figure is not None
-
-    def test_figure_with_varying_elevations(self):
-        """Test figure handles different elevation levels."""
-        df = DataFrame(
-            [
-                {
-                    "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 5, tzinfo=timezone.utc),
-                    "elevation": 1,
-                    "commit_counts": 3,
-                    "head": "c1",
-                    "tail": "c2",
-                    "duration": 4,
-                    "density": 1.33,
-                },
-                {
-                    "first": datetime(2024, 1, 3, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 8, tzinfo=timezone.utc),
-                    "elevation": 2,
-                    "commit_counts": 4,
-                    "head": "c3",
-                    "tail": "c4",
-                    "duration": 5,
-                    "density": 1.25,
-                },
-                {
-                    "first": datetime(2024, 1, 6, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 12, tzinfo=timezone.utc),
-                    "elevation": 3,
-                    "commit_counts": 5,
-                    "head": "c5",
-                    "tail": "c6",
-                    "duration": 6,
-                    "density": 1.2,
-                },
-            ]
-        )
+    # Label keys are part of the public contract
+    assert set(kwargs["labels"].keys()) == {
+        "elevation",
+        "density",
+        "first",
+        "last",
+        "duration",
+    }
 
-        figure = create_timeline_figure(df)
-
-        assert figure is not None
-        assert len(figure.data) > 0
-
-    def test_figure_with_varying_density(self):
-        """Test figure handles different density values for coloring."""
-        df = DataFrame(
-            [
-                {
-                    "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 10, tzinfo=timezone.utc),
-                    "elevation": 1,
-                    "commit_counts": 10,
-                    "head": "c1",
-                    "tail": "c2",
-                    "duration": 9,
-                    "density": 0.9,  # Low density (many commits)
-                },
-                {
-                    "first": datetime(2024, 1, 15, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 25, tzinfo=timezone.utc),
-                    "elevation": 1,
-                    "commit_counts": 2,
-                    "head": "c3",
-                    "tail": "c4",
-                    "duration": 10,
-                    "density": 5.0,  # High density (few commits)
-                },
-            ]
-        )
 
-        figure = create_timeline_figure(df)
-
-        assert figure is not None
-        assert len(figure.data) > 0
-
-    def test_figure_returns_plotly_figure_type(self):
-        """Test that return type is a Plotly Figure."""
-        df = DataFrame(
-            [
-                {
-                    "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 10, tzinfo=timezone.utc),
-                    "elevation": 1,
-                    "commit_counts": 5,
-                    "head": "abc",
-                    "tail": "def",
-                    "duration": 9,
-                    "density": 1.8,
-                }
-            ]
-        )
+def test_hover_data_configuration_is_as_expected(single_row_df):
+    """Test that px.timeline is called with the expected hover_data mapping.
 
-        figure = create_timeline_figure(df)
-
-        # Check it's a Plotly figure
-        assert hasattr(figure, "data")
-        assert hasattr(figure, "layout")
-        assert hasattr(figure, "to_json")
-
-    def test_column_mappings_and_label_keys_are_as_expected(self):
-        """Test that px.timeline is called with expected columns and label keys.
-
-        This ensures that we treat label *keys* as part of the public
-        contract, while allowing label *values* (strings) to be cosmetic.
-        """
-        df = DataFrame(
-            [
-                {
-                    "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 10, tzinfo=timezone.utc),
-                    "elevation": 1,
-                    "commit_counts": 5,
-                    "head": "abc",
-                    "tail": "def",
-                    "duration": 9,
-                    "density": 1.8,
-                }
-            ]
-        )
+    This treats which fields appear in the tooltip as part of the
+    public contract for the timeline figure.
+    """
+    with patch("algorithms.figure_builder.px.timeline") as mock_timeline:
+        sentinel_figure = object()
+        mock_timeline.return_value = sentinel_figure
 
-        with patch("algorithms.figure_builder.px.timeline") as mock_timeline:
-            sentinel_figure = object()
-            mock_timeline.return_value = sentinel_figure
-
-            result = create_timeline_figure(df)
-
-        # We should return whatever px.timeline returned
-        assert result is sentinel_figure
-
-        _, kwargs = mock_timeline.call_args
-
-        # Column mappings
-        assert kwargs["x_start"] == "first"
-        assert kwargs["x_end"] == "last"
-        assert kwargs["y"] == "elevation"
-        assert kwargs["color"] == "density"
-        assert kwargs["custom_data"] == ["head", "tail"]
-
-        # Label keys are part of the public contract
-        assert set(kwargs["labels"].keys()) == {
-            "elevation",
-            "density",
-            "first",
-            "last",
-            "duration",
-        }
-
-    def test_hover_data_configuration_is_as_expected(self):
-        """Test that px.timeline is called with the expected hover_data mapping.
-
-        This treats which fields appear in the tooltip as part of the
-        public contract for the timeline figure.
-        """
-        df = DataFrame(
-            [
-                {
-                    "first": datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    "last": datetime(2024, 1, 10, tzinfo=timezone.utc),
-                    "elevation": 1,
-                    "commit_counts": 5,
-                    "head": "abc",
-                    "tail": "def",
-                    "duration": 9,
-                    "density": 1.8,
-                }
-            ]
-        )
+        result = create_timeline_figure(single_row_df)
 
-        with patch("algorithms.figure_builder.px.timeline") as mock_timeline:
-            sentinel_figure = object()
-            mock_timeline.return_value = sentinel_figure
+    assert result is sentinel_figure
 
-            result = create_timeline_figure(df)
+    _, kwargs = mock_timeline.call_args
 
-        assert result is sentinel_figure
+    assert kwargs["hover_data"] == {
+        "first": True,
+        "head": True,
+        "last": True,
+        "tail": True,
+        "commit_counts": True,
+        "duration": True,
+        "elevation": False,
+        "density": True,
+    }
+
+
+def test_shared_figure_config_survives_a_real_build(single_row_df):
+    """px.timeline must not modify the module-level config it is handed."""
+    before = copy.deepcopy(
+        (
+            figure_builder._CUSTOM_DATA,
+            figure_builder._LABELS,
+            figure_builder._HOVER_DATA,
+        )
+    )
 
-        _, kwargs = mock_timeline.call_args
+    create_timeline_figure(single_row_df)
 
-        assert kwargs["hover_data"] == {
-            "first": True,
-            "head": True,
-            "last": True,
-            "tail": True,
-            "commit_counts": True,
-            "duration": True,
-            "elevation": False,
-            "density": True,
-        }
+    assert before == (
+        figure_builder._CUSTOM_DATA,
+        figure_builder._LABELS,
+        figure_builder._HOVER_DATA,
+    )
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__])
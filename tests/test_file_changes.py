@@ -1,31 +1,25 @@
 """Tests for `algorithms/file_changes.py`."""
 
+import shutil
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
+import git
 import pytest
 
 from algorithms.file_changes import (
     FileChangeStats,
+    _blob_size_at_commit,
+    _cached_blob_size,
+    _lines_changed_by_commit,
     file_changes_over_period,
     files_changes_over_period,
 )
-from tests import setup_path
-
-setup_path()
-
 
 _SHAS = ["sha1", "sha2", "sha3", "sha4", "sha5"]
-_SHA_LIST_OUTPUT = "\n".join(_SHAS) + "\n"
-
-_REV_LIST_OUTPUT_BY_FILE = {
-    "nonexistent.py": "",
-    "file1.py": _SHA_LIST_OUTPUT,
-    "file2.py": _SHA_LIST_OUTPUT,
-    "file3.py": _SHA_LIST_OUTPUT,
-}
 
-_SHOW_NUMSTAT_BY_FILE = {
+_NUMSTAT_BY_FILE = {
     "file1.py": "5\t5\tfile1.py\n",  # 10 lines changed
     "file2.py": "10\t10\tfile2.py\n",  # 20 lines changed
     "file3.py": "15\t15\tfile3.py\n",  # 30 lines changed
@@ -37,17 +31,19 @@ _CAT_FILE_SIZE_BY_SHA = {
 }
 
 
-def _rev_list_side_effect(*args: str) -> str:
+def _log_output(shas: list[str], numstat: str) -> str:
+    # Mirrors `git log --numstat --format=%H`: SHA, blank line, numstat.
+    return "".join(f"{sha}\n\n{numstat}" for sha in shas)
+
+
+def _log_side_effect(*args: str) -> str:
     # args ends with: "--", <target_file>
     target_file = args[-1]
     if target_file == "error.py":
         raise ValueError("File not found")
-    return _REV_LIST_OUTPUT_BY_FILE.get(target_file, _SHA_LIST_OUTPUT)
-
-
-def _show_side_effect(_sha: str, *args: str) -> str:
-    target_file = args[-1]
-    return _SHOW_NUMSTAT_BY_FILE.get(target_file, "")
+    if target_file == "nonexistent.py":
+        return ""
+    return _log_output(_SHAS, _NUMSTAT_BY_FILE.get(target_file, ""))
 
 
 def _cat_file_side_effect(_flag: str, spec: str) -> str:
@@ -56,24 +52,35 @@ def _cat_file_side_effect(_flag: str, spec: str) -> str:
     return _CAT_FILE_SIZE_BY_SHA.get(sha, "1100")
 
 
+class FakeRepo:
+    """Stand-in for git.Repo with only the git commands the module runs.
+
+    Plain objects instead of a MagicMock tree; the two commands stay Mocks
+    so tests can check their calls, and any other git command raises
+    AttributeError. Instances hash by identity, as the lru_caches need.
+    """
+
+    def __init__(self):
+        self.git = SimpleNamespace(
+            log=Mock(side_effect=_log_side_effect),
+            cat_file=Mock(side_effect=_cat_file_side_effect),
+        )
+
+
 @pytest.fixture
-def mock_repo():
-    """Create a mock Git repository for testing."""
-    repo = MagicMock()
-    repo.git = MagicMock()
-    repo.git.rev_list.side_effect = _rev_list_side_effect
-    repo.git.show.side_effect = _show_side_effect
-    repo.git.cat_file.side_effect = _cat_file_side_effect
-    return repo
+def fake_repo():
+    """A fresh FakeRepo; clears the blob-size cache afterwards."""
+    yield FakeRepo()
+    _cached_blob_size.cache_clear()
 
 
-def test_file_changes_over_period(mock_repo):
+def test_file_changes_over_period(fake_repo):
     (commits, avg_changes, total_change, percent_change) = (
         file_changes_over_period(
             "file1.py",
             start=datetime.now() - timedelta(days=30),
             end=datetime.now(),
-            repo=mock_repo,
+            repo=fake_repo,
         )
     )
 
@@ -82,19 +89,19 @@ def test_file_changes_over_period(mock_repo):
     assert total_change == 200
     assert percent_change == 20.0
 
-    # Primary contract: we query git for commits and per-commit stats.
-    assert mock_repo.git.rev_list.called
-    assert mock_repo.git.show.called
-    assert mock_repo.git.cat_file.called
+    # Primary contract: one git log stream for commits and their stats,
+    # then blob sizes.
+    assert fake_repo.git.log.call_count == 1
+    assert fake_repo.git.cat_file.called
 
 
-def test_file_changes_over_period_no_commits(mock_repo):
+def test_file_changes_over_period_no_commits(fake_repo):
     (commits, avg_changes, total_change, percent_change) = (
         file_changes_over_period(
             "nonexistent.py",
             start=datetime.now() - timedelta(days=30),
             end=datetime.now(),
-            repo=mock_repo,
+            repo=fake_repo,
         )
     )
 
@@ -104,13 +111,13 @@ def test_file_changes_over_period_no_commits(mock_repo):
     assert percent_change == 0.0
 
 
-def test_files_changes_over_period(mock_repo):
+def test_files_changes_over_period(fake_repo):
     """Test the files_changes_over_period function with a mock repository."""
     results = files_changes_over_period(
         ["file1.py", "file2.py", "file3.py"],
         start=datetime.now() - timedelta(days=30),
         end=datetime.now(),
-        repo=mock_repo,
+        repo=fake_repo,
     )
     assert len(results) == 3
     assert isinstance(results["file1.py"], FileChangeStats)
@@ -122,12 +129,12 @@ def test_files_changes_over_period(mock_repo):
     assert results["file3.py"].avg_changes == 30.0
 
 
-def test_files_changes_over_period_with_error(mock_repo):
+def test_files_changes_over_period_with_error(fake_repo):
     results = files_changes_over_period(
         ["file1.py", "error.py", "file3.py"],
         start=datetime.now() - timedelta(days=30),
         end=datetime.now(),
-        repo=mock_repo,
+        repo=fake_repo,
     )
 
     assert len(results) == 3
@@ -136,19 +143,74 @@ def test_files_changes_over_period_with_error(mock_repo):
     assert results["file3.py"].commits == 5
 
 
-def test_files_changes_over_period_empty_list(mock_repo):
+def test_files_changes_over_period_empty_list(fake_repo):
     """Test the files_changes_over_period function with an empty list of files."""
     results = files_changes_over_period(
         [],
         start=datetime.now() - timedelta(days=30),
         end=datetime.now(),
-        repo=mock_repo,
+        repo=fake_repo,
     )
     assert len(results) == 0
 
 
+def test_files_changes_over_period_reuses_results_for_same_query(fake_repo):
+    """Repeating a query (in any file order) does not walk git again."""
+    start = datetime.now() - timedelta(days=30)
+    end = datetime.now()
+
+    first = files_changes_over_period(
+        ["file1.py", "file2.py"], start=start, end=end, repo=fake_repo
+    )
+    calls_after_first = fake_repo.git.log.call_count
+    second = files_changes_over_period(
+        ["file2.py", "file1.py"], start=start, end=end, repo=fake_repo
+    )
+
+    assert second == first
+    assert fake_repo.git.log.call_count == calls_after_first
+
+
+def test_files_changes_over_period_retries_after_a_git_failure(fake_repo):
+    """A batch where git failed is not cached; the failed file is retried."""
+    start = datetime.now() - timedelta(days=30)
+    end = datetime.now()
+    fake_repo.git.log.side_effect = OSError("index.lock")
+
+    first = files_changes_over_period(
+        ["file1.py"], start=start, end=end, repo=fake_repo
+    )
+    fake_repo.git.log.side_effect = _log_side_effect
+    second = files_changes_over_period(
+        ["file1.py"], start=start, end=end, repo=fake_repo
+    )
+
+    assert first["file1.py"].commits == 0
+    assert second["file1.py"].commits == 5
+
+
+def test_file_changes_over_period_reuses_blob_sizes(fake_repo):
+    """Walking the same commits again does not re-run cat-file."""
+    file_changes_over_period("file1.py", repo=fake_repo)
+    cat_file_calls = fake_repo.git.cat_file.call_count
+
+    file_changes_over_period(
+        "file1.py", start=datetime(2000, 1, 1), repo=fake_repo
+    )
+
+    assert fake_repo.git.cat_file.call_count == cat_file_calls
+
+
+def test_blob_size_failure_is_not_cached(fake_repo):
+    """A transient cat-file error reads as 0 once, then the size is retried."""
+    fake_repo.git.cat_file.side_effect = [OSError("index.lock"), "42\n"]
+
+    assert _blob_size_at_commit(fake_repo, "sha1", "file1.py") == 0
+    assert _blob_size_at_commit(fake_repo, "sha1", "file1.py") == 42
+
+
 def test_file_changes_over_period_uses_default_window_when_start_end_none(
-    monkeypatch, mock_repo
+    monkeypatch, fake_repo
 ):
     """When start/end are None, use a 1-year window ending at now()."""
     fixed_now = datetime(2025, 1, 1, 12, 0, 0)
@@ -162,9 +224,10 @@ def test_file_changes_over_period_uses_default_window_when_start_end_none(
     monkeypatch.setattr("algorithms.file_changes.datetime", FixedDateTime)
 
     with patch(
-        "algorithms.file_changes._commits_touching_file"
+        "algorithms.file_changes._lines_changed_by_commit",
+        return_value=dict.fromkeys(_SHAS, 10),
     ) as mock_commits:
-        file_changes_over_period("file1.py", repo=mock_repo)
+        file_changes_over_period("file1.py", repo=fake_repo)
 
     assert mock_commits.call_count == 1
     _repo, _target_file, start, end = mock_commits.call_args[0]
@@ -172,33 +235,113 @@ def test_file_changes_over_period_uses_default_window_when_start_end_none(
     assert end == fixed_now
 
 
-def test_file_changes_over_period_passes_each_sha_to_lines_changed(mock_repo):
-    """Each SHA returned by _commits_touching_file must be passed to the helper."""
-    with (
-        patch(
-            "algorithms.file_changes._commits_touching_file",
-            return_value=_SHAS,
-        ),
-        patch("algorithms.file_changes._lines_changed_in_commit") as mock_lines,
-    ):
-        mock_lines.return_value = 10
-        file_changes_over_period("file1.py", repo=mock_repo)
+def test_lines_changed_by_commit_reads_each_sha_from_one_log_stream(
+    fake_repo,
+):
+    """Every SHA in the log stream is kept, in order, with its first numstat.
+
+    Merges simplified away by git and binary files ("-") count as zero;
+    later numstat lines for the same commit are ignored.
+    """
+    fake_repo.git.log.side_effect = None
+    fake_repo.git.log.return_value = (
+        "sha1\n\n3\t4\tfile1.py\n"
+        "sha2\n"
+        "sha3\n\n-\t-\tfile1.py\n"
+        "sha4\n\n1\t1\tfile1.py\n9\t9\told/file1.py\n"
+    )
+
+    lines_by_sha = _lines_changed_by_commit(
+        fake_repo, "file1.py", datetime(2025, 1, 1), datetime(2025, 2, 1)
+    )
+
+    assert lines_by_sha == {"sha1": 7, "sha2": 0, "sha3": 0, "sha4": 2}
+    assert list(lines_by_sha) == ["sha1", "sha2", "sha3", "sha4"]
+    assert fake_repo.git.log.call_args.args[-2:] == ("--", "file1.py")
+    # --diff-merges needs git 2.31+; --cc works everywhere.
+    assert "--cc" in fake_repo.git.log.call_args.args
+
+
+@pytest.fixture
+def merge_and_rename_repo(tmp_path):
+    """A real repository with a conflicting merge, a clean merge and a rename."""
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+    repo = git.Repo.init(tmp_path)
+    repo.git.config("user.email", "dev@example.com")
+    repo.git.config("user.name", "Dev")
+
+    def commit(message, files):
+        for name, text in files.items():
+            (tmp_path / name).write_text(text)
+        repo.git.add("-A")
+        repo.git.commit("-q", "-m", message)
+
+    commit("init", {"f.txt": "1\n2\n3\n", "g.txt": "x\n", "old.txt": "a\nb\n"})
+    trunk = repo.active_branch.name
+    repo.git.checkout("-q", "-b", "side")
+    commit("side", {"f.txt": "1\nS\n3\n", "g.txt": "x\ns\n"})
+    repo.git.checkout("-q", trunk)
+    commit("trunk", {"f.txt": "1\nM\n3\n", "h.txt": "h\n"})
+    with pytest.raises(git.GitCommandError):
+        repo.git.merge("-q", "side")
+    commit("conflicting merge", {"f.txt": "1\nX\nY\n3\n"})
+    repo.git.checkout("-q", "-b", "side2")
+    commit("side2", {"g.txt": "x\ns\nt\n"})
+    repo.git.checkout("-q", trunk)
+    commit("trunk2", {"h.txt": "h\ni\n"})
+    repo.git.merge("-q", "--no-edit", "side2")
+    repo.git.mv("old.txt", "new.txt")
+    commit("rename", {"new.txt": "a\nb\nc\n"})
+    return repo
+
+
+def _lines_changed_per_git_show(repo, target_file):
+    """The pre-log-stream reference: rev-list, then git show per commit."""
+    lines_by_sha = {}
+    for sha in repo.git.rev_list("--all", "--", target_file).split():
+        numstat = repo.git.show(
+            sha, "--numstat", "--format=", "--", target_file
+        )
+        adds, dels, *_ = (numstat.splitlines() or ["0\t0"])[0].split("\t")
+        lines_by_sha[sha] = int(adds) + int(dels)
+    return lines_by_sha
+
+
+@pytest.mark.parametrize(
+    "target_file", ["f.txt", "g.txt", "new.txt", "old.txt"]
+)
+def test_lines_changed_by_commit_matches_git_show_on_merges_and_renames(
+    merge_and_rename_repo, target_file
+):
+    """One log stream gives the same per-commit counts as git show did.
+
+    f.txt goes through a conflicting merge, g.txt through a clean one, and
+    old.txt is renamed to new.txt with an edit.
+    """
+    lines_by_sha = _lines_changed_by_commit(
+        merge_and_rename_repo,
+        target_file,
+        datetime(2000, 1, 1),
+        datetime.now() + timedelta(days=1),
+    )
 
-    called_shas = [call.args[1] for call in mock_lines.call_args_list]
-    assert called_shas == _SHAS
+    expected = _lines_changed_per_git_show(merge_and_rename_repo, target_file)
+    assert lines_by_sha == expected
+    assert list(lines_by_sha) == list(expected)
 
 
-def test_file_changes_over_period_passes_correct_args_to_blob_size(mock_repo):
+def test_file_changes_over_period_passes_correct_args_to_blob_size(fake_repo):
     """_blob_size_at_commit must be called with (repo, sha, target_file)."""
     with (
         patch(
-            "algorithms.file_changes._commits_touching_file",
-            return_value=_SHAS,
+            "algorithms.file_changes._lines_changed_by_commit",
+            return_value=dict.fromkeys(_SHAS, 10),
         ),
         patch("algorithms.file_changes._blob_size_at_commit") as mock_blob,
     ):
         mock_blob.return_value = 1000
-        file_changes_over_period("file1.py", repo=mock_repo)
+        file_changes_over_period("file1.py", repo=fake_repo)
 
     calls = mock_blob.call_args_list
     assert len(calls) == 2
@@ -206,26 +349,26 @@ def test_file_changes_over_period_passes_correct_args_to_blob_size(mock_repo):
     (repo1, oldest_sha, path1), _ = calls[0]
     (repo2, newest_sha, path2), _ = calls[1]
 
-    assert repo1 is mock_repo
-    assert repo2 is mock_repo
+    assert repo1 is fake_repo
+    assert repo2 is fake_repo
     assert (oldest_sha, newest_sha) == (_SHAS[-1], _SHAS[0])
     assert path1 == path2 == "file1.py"
 
 
-def test_file_changes_over_period_no_lines_changed_keeps_avg_at_zero(mock_repo):
+def test_file_changes_over_period_no_lines_changed_keeps_avg_at_zero(fake_repo):
     """If numstat output is empty, avg_changes should be 0.0, not 1.0."""
 
-    def no_changes_show_side_effect(_sha: str, *args: str) -> str:
-        return ""  # no numstat lines at all
+    def no_changes_log_side_effect(*args: str) -> str:
+        return _log_output(_SHAS, "")  # no numstat lines at all
 
-    mock_repo.git.show.side_effect = no_changes_show_side_effect
+    fake_repo.git.log.side_effect = no_changes_log_side_effect
 
     commits, avg_changes, total_change, percent_change = (
         file_changes_over_period(
             "file1.py",
             start=datetime.now() - timedelta(days=30),
             end=datetime.now(),
-            repo=mock_repo,
+            repo=fake_repo,
         )
     )
 
@@ -234,7 +377,7 @@ def test_file_changes_over_period_no_lines_changed_keeps_avg_at_zero(mock_repo):
 
 
 def test_file_changes_over_period_zero_original_size_has_zero_percent_change(
-    mock_repo,
+    fake_repo,
 ):
     """When original size is 0, percent_change must be 0.0 (no division)."""
 
@@ -244,20 +387,20 @@ def test_file_changes_over_period_zero_original_size_has_zero_percent_change(
             return "0"
         return "100"
 
-    mock_repo.git.cat_file.side_effect = zero_size_cat_file
+    fake_repo.git.cat_file.side_effect = zero_size_cat_file
 
     _, _, _, percent_change = file_changes_over_period(
         "file1.py",
         start=datetime.now() - timedelta(days=30),
         end=datetime.now(),
-        repo=mock_repo,
+        repo=fake_repo,
     )
 
     assert percent_change == 0.0
 
 
 def test_file_changes_over_period_small_original_size_computes_percent(
-    mock_repo,
+    fake_repo,
 ):
     """When original size is 1, percent_change should still be computed."""
 
@@ -269,13 +412,13 @@ def test_file_changes_over_period_small_original_size_computes_percent(
             return "2"
         return "1"
 
-    mock_repo.git.cat_file.side_effect = tiny_sizes_cat_file
+    fake_repo.git.cat_file.side_effect = tiny_sizes_cat_file
 
     _, _, _, percent_change = file_changes_over_period(
         "file1.py",
         start=datetime.now() - timedelta(days=30),
         end=datetime.now(),
-        repo=mock_repo,
+        repo=fake_repo,
     )
 
     assert percent_change == 100.0
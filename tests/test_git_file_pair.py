@@ -1,6 +1,6 @@
 import unittest
 from datetime import datetime
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 from tests.conftest import create_mock_commit_with_diffs
 from utils.git import get_commits_for_file_pair
@@ -10,8 +10,7 @@ class TestGetCommitsForFilePair(unittest.TestCase):
 
     def test_empty_repo(self):
         """Test with no commits in the repo."""
-        repo = Mock()
-        repo.iter_commits = Mock(return_value=[])
+        repo = SimpleNamespace(iter_commits=lambda: [])
         start = datetime(2025, 1, 1)
         end = datetime(2025, 12, 31)
         result = get_commits_for_file_pair(
@@ -41,8 +40,7 @@ class TestGetCommitsForFilePair(unittest.TestCase):
             date=datetime(2025, 8, 10, 9, 45),
             modified_files=["file1.py", "file2.py", "other.py"],
         )
-        repo = Mock()
-        repo.iter_commits = Mock(return_value=[commit1, commit2, commit3])
+        repo = SimpleNamespace(iter_commits=lambda: [commit1, commit2, commit3])
         result = get_commits_for_file_pair(
             repo, "file1.py", "file2.py", start, end
         )
@@ -75,8 +73,7 @@ class TestGetCommitsForFilePair(unittest.TestCase):
             date=datetime(2025, 9, 10, 9, 45),
             modified_files=["file1.py", "file2.py"],
         )
-        repo = Mock()
-        repo.iter_commits = Mock(return_value=[commit1, commit2, commit3])
+        repo = SimpleNamespace(iter_commits=lambda: [commit1, commit2, commit3])
         result = get_commits_for_file_pair(
             repo, "file1.py", "file2.py", start, end
         )
@@ -95,8 +92,7 @@ class TestGetCommitsForFilePair(unittest.TestCase):
             date=datetime(2025, 6, 15, 10, 30),
             modified_files=["file1.py", "file2.py"],
         )
-        repo = Mock()
-        repo.iter_commits = Mock(return_value=[commit])
+        repo = SimpleNamespace(iter_commits=lambda: [commit])
         result = get_commits_for_file_pair(
             repo, "file1.py", "file2.py", start, end
         )
@@ -114,8 +110,7 @@ class TestGetCommitsForFilePair(unittest.TestCase):
             date=datetime(2025, 6, 15, 10, 30),
             modified_files=None,
         )
-        repo = Mock()
-        repo.iter_commits = Mock(return_value=[commit])
+        repo = SimpleNamespace(iter_commits=lambda: [commit])
         result = get_commits_for_file_pair(
             repo, "file1.py", "file2.py", start, end
         )
@@ -1,6 +1,3 @@
-from tests import setup_path
-
-setup_path()
 import types
 
 import networkx as nx
@@ -29,30 +26,50 @@ def capture_commits_call(monkeypatch):
     return called
 
 
+# Page name -> (callback name, callback arguments).
+TARGETS = {
+    "most_committed": ("populate_graph", lambda: (STORE,)),
+    "conventional": ("update_conventional_table", lambda: (None, STORE)),
+    "diff_summary": ("update_graph", lambda: (None, STORE)),
+    "merges": ("update_merge_graph", lambda: (1, STORE)),
+    "codelines": ("update_code_lines_graph", lambda: (1, STORE)),
+    "strongest_pairings": ("handle_period_selection", lambda: (STORE,)),
+}
+
+
+@pytest.fixture(scope="module")
+def page_modules():
+    """Import every page under test once, rather than once per row."""
+    from pages import (
+        codelines,
+        conventional,
+        diff_summary,
+        merges,
+        most_committed,
+        strongest_pairings,
+    )
+
+    return {
+        "most_committed": most_committed,
+        "conventional": conventional,
+        "diff_summary": diff_summary,
+        "merges": merges,
+        "codelines": codelines,
+        "strongest_pairings": strongest_pairings,
+    }
+
+
 @pytest.mark.parametrize(
-    "target, build_args",
-    [
-        ("pages.most_committed.populate_graph", lambda: (STORE,)),
-        ("pages.conventional.update_conventional_table", lambda: (None, STORE)),
-        ("pages.diff_summary.update_graph", lambda: (None, STORE)),
-        ("pages.merges.update_merge_graph", lambda: (1, STORE)),
-        ("pages.codelines.update_code_lines_graph", lambda: (1, STORE)),
-        ("pages.strongest_pairings.handle_period_selection", lambda: (STORE,)),
-    ],
+    "page, func_name, build_args",
+    [(page, *target) for (page, target) in TARGETS.items()],
+    ids=list(TARGETS),
 )
 def test_page_uses_store_begin_end(
-    target, build_args, capture_commits_call, monkeypatch
+    page, func_name, build_args, page_modules, capture_commits_call, monkeypatch
 ):
-    # Page modules call `dash.register_page` at import-time; make this test
-    # independent of Dash app instantiation / page registry global state.
-    import dash
-
-    monkeypatch.setattr(dash, "register_page", lambda *a, **k: None)
-
-    (module_name, func_name) = target.rsplit(".", 1)
-    mod = __import__(module_name, fromlist=[func_name])
+    mod = page_modules[page]
     fn = getattr(mod, func_name)
-    if module_name == "pages.most_committed":
+    if page == "most_committed":
         monkeypatch.setattr(
             mod,
             "calculate_file_commit_frequency",
@@ -82,10 +99,6 @@ def test_affinity_groups_uses_store_begin_end(
     global store into `data.commits_in_period`. The heavy computation and
     visualization functions are stubbed out to avoid expensive work.
     """
-    import dash
-
-    monkeypatch.setattr(dash, "register_page", lambda *a, **k: None)
-
     from pages import affinity_groups as ag
 
     mock_graph = nx.Graph()
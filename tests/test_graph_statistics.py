@@ -4,6 +4,7 @@ from types import SimpleNamespace
 from unittest.mock import patch
 
 import networkx as nx
+import pytest
 
 from algorithms.graph_statistics import (
     calculate_graph_statistics,
@@ -19,24 +20,30 @@ def _mock_commit(*files: str):
     return SimpleNamespace(stats=SimpleNamespace(files={f: {} for f in files}))
 
 
-def test_count_files_in_commits_counts_occurrences_across_commits():
-    commits = [
+@pytest.fixture(scope="module")
+def three_commits():
+    """A 2-file, a 3-file and a single-file commit; read-only."""
+    return [
         _mock_commit("a.py", "b.py"),
-        _mock_commit("b.py", "c.py"),
+        _mock_commit("a.py", "b.py", "c.py"),
         _mock_commit("a.py"),
     ]
 
-    assert count_files_in_commits(commits) == {"a.py": 2, "b.py": 2, "c.py": 1}
 
+def test_count_files_in_commits_counts_occurrences_across_commits(
+    three_commits,
+):
+    assert count_files_in_commits(three_commits) == {
+        "a.py": 3,
+        "b.py": 2,
+        "c.py": 1,
+    }
 
-def test_count_multi_file_commits_counts_commits_with_two_or_more_files():
-    commits = [
-        _mock_commit("a.py"),
-        _mock_commit("a.py", "b.py"),
-        _mock_commit("a.py", "b.py", "c.py"),
-    ]
 
-    assert count_multi_file_commits(commits) == 2
+def test_count_multi_file_commits_counts_commits_with_two_or_more_files(
+    three_commits,
+):
+    assert count_multi_file_commits(three_commits) == 2
 
 
 def test_filter_low_degree_nodes_removes_nodes_below_threshold_and_returns_count_removed():
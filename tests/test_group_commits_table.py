@@ -10,9 +10,8 @@ from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
-from dash import Dash
 
-app = Dash(__name__, suppress_callback_exceptions=True)
+from tests.conftest import create_mock_commit_with_diffs
 
 
 @patch("pages.affinity_groups.data.commits_in_period")
@@ -22,30 +21,19 @@ def test_get_commits_for_group_files_with_multiple_file_commits(
     """Test that commits containing at least 2 group files are returned."""
     from algorithms.commit_filter import get_commits_for_group_files
 
-    # Mock commits
-    mock_commit1 = Mock()
-    mock_commit1.hexsha = "abc123def456"
-    mock_commit1.committed_datetime = datetime(2024, 1, 15, 10, 30)
-    mock_commit1.message = "feat: update main and utils"
-    mock_commit1.parents = [Mock()]
-
-    # Mock diff to show both files were modified
-    diff_item1 = Mock()
-    diff_item1.a_path = "src/main.py"
-    diff_item2 = Mock()
-    diff_item2.a_path = "src/utils.py"
-    mock_commit1.diff.return_value = [diff_item1, diff_item2]
-
-    # Mock commit with only one file
-    mock_commit2 = Mock()
-    mock_commit2.hexsha = "xyz789ghi012"
-    mock_commit2.committed_datetime = datetime(2024, 1, 16, 14, 20)
-    mock_commit2.message = "fix: update helper"
-    mock_commit2.parents = [Mock()]
-
-    diff_item3 = Mock()
-    diff_item3.a_path = "src/helper.py"
-    mock_commit2.diff.return_value = [diff_item3]
+    mock_commit1 = create_mock_commit_with_diffs(
+        hexsha="abc123def456",
+        message="feat: update main and utils",
+        date=datetime(2024, 1, 15, 10, 30),
+        modified_files=["src/main.py", "src/utils.py"],
+    )
+    # Only one file changed, so this commit is left out
+    mock_commit2 = create_mock_commit_with_diffs(
+        hexsha="xyz789ghi012",
+        message="fix: update helper",
+        date=datetime(2024, 1, 16, 14, 20),
+        modified_files=["src/helper.py"],
+    )
 
     commits = [mock_commit1, mock_commit2]
     group_files = ["src/main.py", "src/utils.py", "src/helper.py"]
@@ -68,15 +56,12 @@ def test_get_commits_for_group_files_with_no_matching_commits(
     """Test that no commits are returned when no commits have 2+ group files."""
     from algorithms.commit_filter import get_commits_for_group_files
 
-    mock_commit = Mock()
-    mock_commit.hexsha = "abc123"
-    mock_commit.committed_datetime = datetime(2024, 1, 15, 10, 30)
-    mock_commit.message = "feat: update single file"
-    mock_commit.parents = [Mock()]
-
-    diff_item = Mock()
-    diff_item.a_path = "src/other.py"
-    mock_commit.diff.return_value = [diff_item]
+    mock_commit = create_mock_commit_with_diffs(
+        hexsha="abc123",
+        message="feat: update single file",
+        date=datetime(2024, 1, 15, 10, 30),
+        modified_files=["src/other.py"],
+    )
 
     commits = [mock_commit]
     group_files = ["src/main.py", "src/utils.py"]
@@ -5,25 +5,17 @@ This file contains tests for the populate_graph callback function,
 specifically testing edge cases like empty data.
 """
 
-from tests import setup_path
-
-setup_path()
-import os
-import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 
 @pytest.fixture
 def populate_graph():
     """Import and return the populate_graph function with proper mocking."""
-    with patch("dash.register_page"):
-        from pages.most_committed import populate_graph as pg
+    from pages.most_committed import populate_graph as pg
 
-        return pg
+    return pg
 
 
 @pytest.fixture
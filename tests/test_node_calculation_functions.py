@@ -7,9 +7,6 @@ Tests cover:
 - _get_top_files_and_affinities: Top files and affinity identification
 """
 
-from tests import setup_path
-
-setup_path()
 from collections import defaultdict
 
 import pytest
@@ -1,7 +1,3 @@
-from tests import setup_path
-
-setup_path()
-
 import sys
 
 import pytest
@@ -17,10 +17,9 @@ def parse_record(result):
 class MyTestCase(unittest.TestCase):
 
     def setUp(self):
-        with patch("dash.register_page"):
-            from pages.strongest_pairings import create_affinity_list
+        from pages.strongest_pairings import create_affinity_list
 
-            self.create_affinity_list = create_affinity_list
+        self.create_affinity_list = create_affinity_list
 
     def test_empty_inputs(self):
         self.assertEqual([], self.create_affinity_list([]))
@@ -28,6 +28,13 @@ class MyTestCase(unittest.TestCase):
         x = stacker.height_for([2, 3])
         self.assertEqual(x, 2)
 
+    def test_sequence_fits_into_gap_between_existing(self):
+        stacker = SequenceStacker()
+        stacker.height_for([10, 15])
+        stacker.height_for([1, 5])
+        self.assertEqual(stacker.height_for([6, 9]), 1)
+        self.assertEqual(stacker.height_for([5, 10]), 2)
+
     def repeated_overlaps(self):
         test_cases = [
             ([1, 5], 1),
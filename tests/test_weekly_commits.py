@@ -290,21 +290,17 @@ class TestWeeklyCommitsCallback(unittest.TestCase):
 
     def test_click_event_triggers_callback(self):
         """Test that clicking on a bar triggers the callback."""
-        from unittest.mock import patch
-
-        with patch("dash.register_page"):
-
-            # Verify the callback exists by attempting to import it
-            try:
-                from pages.weekly_commits import update_commit_details_table
+        # Verify the callback exists by attempting to import it
+        try:
+            from pages.weekly_commits import update_commit_details_table
 
-                callback_exists = True
-            except ImportError:
-                callback_exists = False
+            callback_exists = True
+        except ImportError:
+            callback_exists = False
 
-            assert (
-                callback_exists
-            ), "Callback update_commit_details_table should exist"
+        assert (
+            callback_exists
+        ), "Callback update_commit_details_table should exist"
 
     def test_callback_produces_table_from_fake_week_data(self):
         """Test that given fake data of a week's commits, the callback produces the correct table."""
@@ -345,15 +341,12 @@ class TestWeeklyCommitsCallback(unittest.TestCase):
             ]
         }
 
-        with (
-            patch("dash.register_page"),
-            patch("pages.weekly_commits.data.get_repo") as mock_repo,
-        ):
+        with patch("pages.weekly_commits.data.get_repo") as mock_repo:
             mock_repo_obj = Mock()
-            mock_repo_obj.commit.side_effect = lambda sha: {
+            mock_repo_obj.commit.side_effect = {
                 "abc123": commit1,
                 "def456": commit2,
-            }[sha]
+            }.__getitem__
             mock_repo.return_value = mock_repo_obj
 
             from pages.weekly_commits import update_commit_details_table
@@ -376,60 +369,51 @@ class TestWeeklyCommitsCallback(unittest.TestCase):
 
     def test_none_click_data_returns_empty_table(self):
         """Test that None click_data returns empty table and default message."""
-        from unittest.mock import patch
+        from pages.weekly_commits import update_commit_details_table
 
-        with patch("dash.register_page"):
-            from pages.weekly_commits import update_commit_details_table
-
-            store_data = {"weeks": []}
-            table_data, message = update_commit_details_table(None, store_data)
+        store_data = {"weeks": []}
+        table_data, message = update_commit_details_table(None, store_data)
 
-            assert table_data == []
-            assert message == "Click on a week's bar to see commit details."
+        assert table_data == []
+        assert message == "Click on a week's bar to see commit details."
 
     def test_invalid_store_data_returns_empty_table(self):
         """Test that invalid store_data returns empty table and default message."""
-        from unittest.mock import patch
+        from pages.weekly_commits import update_commit_details_table
 
-        with patch("dash.register_page"):
-            from pages.weekly_commits import update_commit_details_table
-
-            click_data = {"points": [{"x": "25-11-02"}]}
+        click_data = {"points": [{"x": "25-11-02"}]}
 
-            # Test with None store_data
-            table_data, message = update_commit_details_table(click_data, None)
-            assert table_data == []
-            assert message == "Click on a week's bar to see commit details."
+        # Test with None store_data
+        table_data, message = update_commit_details_table(click_data, None)
+        assert table_data == []
+        assert message == "Click on a week's bar to see commit details."
 
-            # Test with store_data missing 'weeks'
-            table_data, message = update_commit_details_table(click_data, {})
-            assert table_data == []
-            assert message == "Click on a week's bar to see commit details."
+        # Test with store_data missing 'weeks'
+        table_data, message = update_commit_details_table(click_data, {})
+        assert table_data == []
+        assert message == "Click on a week's bar to see commit details."
 
     def test_no_matching_week_returns_empty_table(self):
         """Test that click_data not matching any week returns empty table and message."""
-        from unittest.mock import patch
+        from pages.weekly_commits import update_commit_details_table
 
-        with patch("dash.register_page"):
-            from pages.weekly_commits import update_commit_details_table
-
-            click_data = {"points": [{"x": "25-12-31"}]}
-            store_data = {
-                "weeks": [
-                    {
-                        "week_ending": "2025-11-02T23:59:59",
-                        "x_label": "25-11-02",
-                        "commits": ["abc123"],
-                    }
-                ]
-            }
+        click_data = {"points": [{"x": "25-12-31"}]}
+        store_data = {
+            "weeks": [
+                {
+                    "week_ending": "2025-11-02T23:59:59",
+                    "x_label": "25-11-02",
+                    "commits": ["abc123"],
+                }
+            ]
+        }
 
-            table_data, message = update_commit_details_table(
-                click_data, store_data
-            )
+        table_data, message = update_commit_details_table(
+            click_data, store_data
+        )
 
-            assert table_data == []
-            assert message == "No commits found for week ending 25-12-31"
+        assert table_data == []
+        assert message == "No commits found for week ending 25-12-31"
 
     def test_valid_week_with_multiple_commits(self):
         """Test that valid week with multiple commits populates table correctly."""
@@ -468,16 +452,13 @@ class TestWeeklyCommitsCallback(unittest.TestCase):
             ]
         }
 
-        with (
-            patch("dash.register_page"),
-            patch("pages.weekly_commits.data.get_repo") as mock_repo,
-        ):
+        with patch("pages.weekly_commits.data.get_repo") as mock_repo:
             mock_repo_obj = Mock()
-            mock_repo_obj.commit.side_effect = lambda sha: {
+            mock_repo_obj.commit.side_effect = {
                 "sha1": commit1,
                 "sha2": commit2,
                 "sha3": commit3,
-            }[sha]
+            }.__getitem__
             mock_repo.return_value = mock_repo_obj
 
             from pages.weekly_commits import update_commit_details_table
@@ -552,18 +533,15 @@ class TestWeeklyCommitsCallback(unittest.TestCase):
             ]
         }
 
-        with (
-            patch("dash.register_page"),
-            patch("pages.weekly_commits.data.get_repo") as mock_repo,
-        ):
+        with patch("pages.weekly_commits.data.get_repo") as mock_repo:
             mock_repo_obj = Mock()
-            mock_repo_obj.commit.side_effect = lambda sha: {
+            mock_repo_obj.commit.side_effect = {
                 "sha1": commit1,
                 "sha2": commit2,
                 "sha3": commit3,
                 "sha4": commit4,
                 "sha5": commit5,
-            }[sha]
+            }.__getitem__
             mock_repo.return_value = mock_repo_obj
 
             from pages.weekly_commits import update_commit_details_table
@@ -25,7 +25,9 @@ PERIOD_OPTIONS: list[str] = [
 DEFAULT_PERIOD: str = "Last 30 days"
 
 
-def calculate_date_range(period: str) -> tuple[datetime, datetime]:
+def calculate_date_range(
+    period: str, now: datetime | None = None
+) -> tuple[datetime, datetime]:
     """
     Calculate start and end datetimes for a period, normalized to full-day boundaries.
 
@@ -35,6 +37,8 @@ def calculate_date_range(period: str) -> tuple[datetime, datetime]:
     Args:
         period: A string representing the time period (e.g., 'Last 30 days', 'Ever')
                 If None or empty, defaults to "30 days"
+        now: The moment the range ends on (default: today). Lets callers and
+             tests pin the clock without patching ``datetime``.
 
     Returns:
         A tuple of (begin_date, end_date) as timezone-aware datetime objects
@@ -48,7 +52,7 @@ def calculate_date_range(period: str) -> tuple[datetime, datetime]:
         >>> (actual_end.date() - begin.date()).days
         30
     """
-    now = datetime.today().astimezone()
+    now = (now or datetime.today()).astimezone()
     # Normalize "end" to end-of-day
     end = now.replace(hour=23, minute=59, second=59, microsecond=0)
     period = period or "30 days"  # pragma: no mutate
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable, Sequence
+from operator import attrgetter
+from threading import Lock
 from typing import TypeVar
 
 from git import Repo
@@ -17,6 +20,8 @@ def get_repo() -> Repo:
 
 T = TypeVar("T")
 
+_message_of = attrgetter("message")
+
 
 def ensure_list(items: Iterable[T] | Sequence[T] | None) -> list[T]:
     """Return a list from any iterable/sequence, handling None.
@@ -31,6 +36,38 @@ def ensure_list(items: Iterable[T] | Sequence[T] | None) -> list[T]:
     return list(items)
 
 
+_CHANGED_FILES_CACHE_SIZE = 16_384
+_changed_files_cache: OrderedDict[tuple[str, str], dict] = OrderedDict()
+_changed_files_lock = Lock()
+
+
+def changed_files(commit) -> dict:
+    """Return ``commit.stats.files``, computed at most once per commit.
+
+    GitPython recomputes ``Commit.stats`` (a ``git diff --numstat``) on every
+    access, so the result is shared across every page that tallies touched
+    files. The cache is keyed on ``(git_dir, hexsha)`` and holds only the
+    files dict: a cached ``Commit`` would keep its ``Repo``, and that repo's
+    ``git cat-file`` processes, alive after ``data`` has dropped it.
+    Commit-like objects without a repo or SHA are read directly.
+    """
+    try:
+        key = (commit.repo.git_dir, commit.hexsha)
+    except AttributeError:
+        return commit.stats.files
+    with _changed_files_lock:
+        files = _changed_files_cache.get(key)
+        if files is not None:
+            _changed_files_cache.move_to_end(key)
+            return files
+    files = commit.stats.files
+    with _changed_files_lock:
+        _changed_files_cache[key] = files
+        if len(_changed_files_cache) > _CHANGED_FILES_CACHE_SIZE:
+            _changed_files_cache.popitem(last=False)
+    return files
+
+
 def tree_entry_size(repo: Repo, commitish, path: str) -> int:
     """Safely fetch the size of a tree entry for a path at a commit.
     Returns 0 if the path does not exist or cannot be read.
@@ -44,7 +81,7 @@ def tree_entry_size(repo: Repo, commitish, path: str) -> int:
 
 def get_commit_messages_for_file(
     repo: Repo, filepath: str, start_date, end_date
-):
+) -> list[str]:
     """Get all commit messages for a specific file during the specified period.
 
     Args:
@@ -53,14 +90,14 @@ def get_commit_messages_for_file(
         start_date: Start of date range
         end_date: End of date range
 
-    Yields:
-        Commit messages (full text)
+    Returns:
+        Commit messages (full text), newest first
     """
     # Use GitPython's built-in filtering for efficiency
-    for commit in repo.iter_commits(
+    commits = repo.iter_commits(
         paths=filepath, since=start_date, until=end_date
-    ):
-        yield commit.message
+    )
+    return list(map(_message_of, commits))
 
 
 def get_commits_for_file_pair(
@@ -78,10 +115,14 @@ def get_commits_for_file_pair(
     Returns:
         List of dicts with keys: hash, date, message
     """
+    # Compare epoch seconds (GitPython's raw committed_date) rather than
+    # building and comparing an aware datetime for every commit in history.
+    start_ts = start_date.timestamp()
+    end_ts = end_date.timestamp()
+
     commits = []
     for commit in repo.iter_commits():
-        commit_date = commit.committed_datetime
-        if not (start_date <= commit_date <= end_date):
+        if not (start_ts <= commit.committed_date <= end_ts):
             continue
 
         # Check if both files were modified in this commit
@@ -95,7 +136,9 @@ def get_commits_for_file_pair(
             commits.append(
                 {
                     "hash": commit.hexsha[:7],
-                    "date": commit_date.strftime("%Y-%m-%d %H:%M"),
+                    "date": commit.committed_datetime.strftime(
+                        "%Y-%m-%d %H:%M"
+                    ),
                     "message": commit.message.split("\n")[0][
                         :80
                     ],  # First line, truncated
@@ -6,6 +6,7 @@ It consolidates the best features from the original implementations in affinity_
 and improved_affinity_network.py.
 """
 
+from collections import defaultdict
 from functools import lru_cache
 from typing import Any
 
@@ -305,22 +306,16 @@ def _create_node_traces(
     # Use distinct color palette
     community_colors = px.colors.qualitative.D3
 
-    # Get community IDs from node attributes
-    community_ids = set(nx.get_node_attributes(G, "community").values())
+    # Group nodes by their community attribute
+    nodes_by_community = _nodes_by_community(G)
 
     # If no communities but nodes exist, create single community
-    if not community_ids and len(G.nodes()) > 0:
+    if not nodes_by_community and len(G.nodes()) > 0:
         node_trace = _create_single_community_trace(G, pos, community_colors[0])
         node_traces.append(node_trace)
     else:
         # Process each community separately
-        for community_id in community_ids:
-            community_nodes = [
-                node
-                for node, data in G.nodes(data=True)
-                if data.get("community") == community_id
-            ]
-
+        for community_id, community_nodes in nodes_by_community.items():
             # Skip single-node communities
             if len(community_nodes) <= 1:
                 continue
@@ -334,6 +329,18 @@ def _create_node_traces(
     return node_traces
 
 
+def _nodes_by_community(G: nx.Graph) -> dict[int, list]:
+    """Map each community ID, in ascending order, to its nodes.
+
+    One pass over the node attributes; nodes without a community are left out.
+    """
+    buckets = defaultdict(list)
+    for node, community_id in G.nodes(data="community"):
+        if community_id is not None:
+            buckets[community_id].append(node)
+    return dict(sorted(buckets.items()))
+
+
 def _create_single_community_trace(
     G: nx.Graph, pos: dict, color: str
 ) -> go.Scatter: